@@ -8,11 +8,14 @@ Converts PDF files into PowerPoint presentations and narrated videos.
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import from our fixed modules
-from pdf2lecture.extractor import extract_text, extract_images, get_pdf_info
-from pdf2lecture.utils import clean_whitespace
+from pdf2lecture.extractor import PdfDocument, extract_text, extract_images, get_pdf_info
+from pdf2lecture.utils import clean_document, clean_whitespace, find_near_duplicates
+from pdf2lecture.cache import ExtractionCache, SummaryCache
+from pdf2lecture.manifest import RunManifest
 
 def test_dependencies():
     """Test if all required dependencies are available."""
@@ -58,7 +61,7 @@ def simple_summarize(text: str, max_slides: int = 10) -> list:
     Simple summarization fallback when transformers is not available.
     Creates slides by splitting text into chunks.
     """
-    from pdf2lecture.utils import chunk_text
+    from pdf2lecture.utils import chunk_text, sentence_spans
     
     # Clean and chunk the text
     cleaned = clean_whitespace(text)
@@ -71,9 +74,9 @@ def simple_summarize(text: str, max_slides: int = 10) -> list:
     # Simple summarization: take first 2 sentences or first 200 chars
     summaries = []
     for chunk in chunks:
-        sentences = chunk.split('.')
-        if len(sentences) >= 2:
-            summary = '.'.join(sentences[:2]) + '.'
+        spans = sentence_spans(chunk)
+        if len(spans) >= 2:
+            summary = chunk[spans[0][0]:spans[1][1]]
         else:
             summary = chunk[:200] + '...' if len(chunk) > 200 else chunk
         summaries.append(summary)
@@ -82,58 +85,300 @@ def simple_summarize(text: str, max_slides: int = 10) -> list:
 
 def run_pipeline(pdf_path: str, output_dir: str = "output", 
                 use_tts: str = "gtts", model_name: str = "facebook/bart-large-cnn",
-                precise_timing: bool = False) -> dict:
+                precise_timing: bool = False, cache: ExtractionCache = None,
+                pages: str = None, max_pages: int = None, sample: int = None,
+                ocr: bool = False, ocr_dpi: int = 200, ocr_workers: int = None,
+                incremental: bool = True, chunk_mode: str = "chars",
+                dedupe: str = "reuse", dedupe_threshold: float = 0.9,
+                batch_size: int = 1, summary_cache: SummaryCache = None,
+                backend: str = "pytorch", summary_workers: int = 1,
+                time_budget: float = None, assistant_model: str = None) -> dict:
     """
     Main pipeline function to convert PDF to lecture materials.
+    
+    With incremental=True, a manifest.json in output_dir records page and
+    chunk hashes, so re-running on a revised PDF only re-extracts,
+    re-summarizes, re-narrates and re-renders what changed.
+    
+    Near-duplicate chunks (recaps, repeated definitions, appendix copies)
+    are detected with SimHash. With dedupe="reuse" they get the summary of
+    their first occurrence without a model call; with dedupe="drop" they
+    are also left out of the slides; dedupe="off" summarizes every chunk.
+    
+    With summary_workers > 1, chunks are summarized by that many worker
+    processes, each with its own copy of the model. With time_budget (in
+    seconds), each chunk goes to model_name, distilbart or the extractive
+    summarizer so that summarization finishes within the budget. With
+    assistant_model (a draft model such as distilbart-cnn-12-6), model_name
+    decodes greedily with the draft proposing tokens (assisted decoding).
+    
+    Summaries are streamed: each slide's image and narration clip are
+    produced on background threads as soon as its summary is ready, while
+    later chunks are still being summarized.
     """
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
     results = {}
+    manifest = RunManifest.load(output_dir) if incremental else RunManifest(output_dir)
     
     print("=" * 60)
     print("PDF to Lecture Generator")
     print("=" * 60)
     
-    # Step 1: PDF Information
-    print("\n[1/7] Analyzing PDF...")
-    pdf_info = get_pdf_info(pdf_path)
-    print(f"   Pages: {pdf_info['pages']}")
-    print(f"   Title: {pdf_info['title'] or 'N/A'}")
-    
-    # Step 2: Text Extraction
-    print("\n[2/7] Extracting text from PDF...")
-    raw_text = extract_text(pdf_path)
-    raw_text = clean_whitespace(raw_text)
-    print(f"   Extracted {len(raw_text)} characters")
-    
-    if len(raw_text) < 100:
-        print("   ERROR: Very little text extracted. PDF may be scanned or image-based.")
-        # Try alternative extraction method
-        print("   Trying alternative extraction method...")
-        raw_text = extract_text(pdf_path, method="fitz")
-        raw_text = clean_whitespace(raw_text)
-        print(f"   Alternative method extracted {len(raw_text)} characters")
+    # Steps 1-2 share one parsed document instead of reopening the file
+    with PdfDocument(pdf_path, cache=cache) as doc:
+        # Step 1: PDF Information
+        print("\n[1/7] Analyzing PDF...")
+        pdf_info = doc.info
+        print(f"   Pages: {pdf_info['pages']}")
+        print(f"   Title: {pdf_info['title'] or 'N/A'}")
+        
+        if pages or max_pages or sample:
+            selected = doc.select_pages(pages, max_pages=max_pages, sample=sample)
+            print(f"   Using {len(selected)} of {pdf_info['pages']} pages")
+        
+        # Step 2: Text Extraction
+        # Pages whose content stream is unchanged since the last run reuse its text
+        page_hashes = {}
+        reused_pages = 0
+        for page_num in doc.page_numbers:
+            page_hashes[page_num] = doc.page_hash(page_num)
+            previous = manifest.previous_page(page_num, page_hashes[page_num])
+            if previous:
+                doc.set_page_text(page_num, previous["text"], previous["engine"])
+                reused_pages += 1
+        
+        # PyMuPDF per page, pdfplumber only for pages where fitz output is degenerate
+        print("\n[2/7] Extracting text from PDF...")
+        page_results = doc.extract_pages(method="auto")
+        raw_text, clean_stats = clean_document([p["text"] for p in page_results if p["text"]])
+        print(f"   Extracted {len(raw_text)} characters")
+        if reused_pages:
+            print(f"   Reused {reused_pages} unchanged pages from the previous run")
+        
+        empty_pages = [p["page"] for p in page_results if not p["text"]]
+        if ocr and empty_pages:
+            print(f"   Running OCR on {len(empty_pages)} pages without a text layer...")
+            ocr_report = doc.ocr_missing_pages(dpi=ocr_dpi, workers=ocr_workers)
+            for page, stats in sorted(ocr_report["pages"].items()):
+                if "error" in stats:
+                    print(f"     Page {page}: OCR failed")
+                    continue
+                source = "cached" if stats["cached"] else f"{stats['seconds']:.1f}s"
+                print(f"     Page {page}: {stats['chars']} chars ({source})")
+            print(f"   OCR finished in {ocr_report['total_seconds']:.1f}s")
+            page_results = doc.extract_pages(method="auto")
+            raw_text, clean_stats = clean_document([p["text"] for p in page_results if p["text"]])
+            print(f"   Extracted {len(raw_text)} characters after OCR")
+        
+        engines = [p["engine"] for p in page_results]
+        for engine in sorted(set(engines)):
+            print(f"   {engine}: {engines.count(engine)} pages")
+        print(f"   Removed {clean_stats['boilerplate_lines']} header/footer lines and joined "
+              f"{clean_stats['hyphens_joined']} hyphenated words "
+              f"(-{clean_stats['chars_removed']} chars, ~-{clean_stats['tokens_removed']} tokens)")
+        
+        for p in page_results:
+            manifest.record_page(p["page"] - 1, page_hashes[p["page"] - 1],
+                                 p["text"], p["engine"])
+        
+        if len(raw_text) < 100:
+            print("   ERROR: Very little text extracted. PDF may be scanned or image-based.")
+            if not ocr:
+                print("   Tip: use --ocr to OCR pages without a text layer")
+    
+    if cache is not None:
+        print(f"   Extraction cache: {cache.hits} hits, {cache.misses} misses")
     
     if len(raw_text) < 50:
         raise Exception("Cannot extract sufficient text from PDF. Please try a different PDF file.")
     
+    # Slide images and narration clips are produced on background threads as
+    # summaries arrive; one thread per stage keeps each file's writes in
+    # submission order. pyttsx3 drives a platform speech engine that is not
+    # thread-safe, so it still runs in step 6.
+    images_dir = os.path.join(output_dir, "slide_images")
+    narration_dir = os.path.join(output_dir, "narration")
+    os.makedirs(images_dir, exist_ok=True)
+    os.makedirs(narration_dir, exist_ok=True)
+    try:
+        from pdf2lecture.slides import load_slide_font, render_slide_image
+        font = load_slide_font()
+        render_error = None
+    except ImportError as e:
+        render_error = e
+    render_pool = ThreadPoolExecutor(max_workers=1)
+    tts_pool = ThreadPoolExecutor(max_workers=1) if use_tts != "pyttsx3" else None
+    submitted = {}  # slide index -> summary its image/clip futures are for
+    image_futures = {}
+    audio_futures = {}
+    
+    def render_one(index, summary):
+        image_path = os.path.join(images_dir, f"slide_{index + 1:02d}.png")
+        previous = manifest.previous_slide(index, summary)
+        if previous.get("image") == image_path and os.path.exists(image_path):
+            return image_path, False
+        render_slide_image(summary, index + 1, image_path, font=font)
+        return image_path, True
+    
+    def narrate_one(index, summary):
+        from pdf2lecture.tts import tts_gtts, tts_pyttsx3
+        clip_path = os.path.join(narration_dir, f"slide_{index + 1:02d}.mp3")
+        previous = manifest.previous_slide(index, summary)
+        if (previous.get("audio") == clip_path and previous.get("tts") == use_tts
+                and os.path.exists(clip_path)):
+            return clip_path, False
+        if use_tts == "pyttsx3":
+            tts_pyttsx3(summary, clip_path)
+        else:
+            tts_gtts(summary, clip_path)
+        return clip_path, True
+    
+    def submit_slide(index, summary):
+        if submitted.get(index) == summary:
+            return
+        submitted[index] = summary
+        if render_error is None:
+            image_futures[index] = render_pool.submit(render_one, index, summary)
+        if tts_pool is not None:
+            audio_futures[index] = tts_pool.submit(narrate_one, index, summary)
+    
     # Step 3: Summarization
     print("\n[3/7] Summarizing content...")
     slide_summaries = []
     overall_summary = ""
     
+    def load_summarizer():
+        from pdf2lecture.summarizer import ShardedSummarizer, Summarizer
+        if time_budget:
+            from pdf2lecture.scheduler import BudgetedSummarizer, DEFAULT_TIERS
+            tiers = [dict(DEFAULT_TIERS[0], model=model_name)] + [
+                tier for tier in DEFAULT_TIERS[1:] if tier["model"] != model_name]
+            return BudgetedSummarizer(time_budget, tiers=tiers, cache=summary_cache,
+                                      backend=backend)
+        if summary_workers > 1:
+            return ShardedSummarizer(model_name=model_name, workers=summary_workers,
+                                     cache=summary_cache, backend=backend,
+                                     assistant_model=assistant_model)
+        return Summarizer(model_name=model_name, cache=summary_cache, backend=backend,
+                          assistant_model=assistant_model)
+    
+    summarizer = None
     try:
-        # Try using transformers if available
-        from pdf2lecture.summarizer import Summarizer
-        summarizer = Summarizer(model_name=model_name)
-        slide_summaries, overall_summary = summarizer.hierarchical_summary(raw_text)
-        print(f"   AI Summarization: Created {len(slide_summaries)} slide summaries")
+        token_ids = None
+        if chunk_mode == "tokens":
+            # Token-budget chunks need the model's tokenizer up front
+            summarizer = load_summarizer()
+            chunks, token_ids = summarizer.chunk_by_tokens(raw_text)
+        else:
+            from pdf2lecture.utils import chunk_text
+            chunks = chunk_text(raw_text, max_chars=1200)
+        
+        # Near-duplicates of an earlier chunk reuse its summary
+        if dedupe != "off":
+            duplicate_of = find_near_duplicates(chunks, threshold=dedupe_threshold)
+        else:
+            duplicate_of = [None] * len(chunks)
+        
+        # Only chunks that changed since the previous run go through the model;
+        # quantized/ONNX output differs slightly, so it is tracked separately
+        summary_model = model_name if backend == "pytorch" else f"{model_name}:{backend}"
+        if time_budget:
+            summary_model += ":budgeted"  # mixed tiers, not all from model_name
+        elif assistant_model and backend == "pytorch":
+            summary_model += ":greedy"  # assisted decoding is greedy, not beam search
+        slide_summaries = [manifest.previous_summary(c, summary_model) for c in chunks]
+        overall_summary = manifest.previous_overall_summary(chunks, summary_model)
+        changed = [i for i, summary in enumerate(slide_summaries)
+                   if summary is None and duplicate_of[i] is None]
+        duplicates = [i for i, summary in enumerate(slide_summaries)
+                      if summary is None and duplicate_of[i] is not None]
+        
+        # Chunk index -> slide index (dropped duplicates get no slide)
+        if dedupe == "drop":
+            originals = [i for i, original in enumerate(duplicate_of) if original is None]
+            slide_index = {i: k for k, i in enumerate(originals)}
+        else:
+            slide_index = {i: i for i in range(len(chunks))}
+        
+        def summary_ready(i, summary):
+            slide_summaries[i] = summary
+            if i in slide_index:
+                submit_slide(slide_index[i], summary)
+        
+        # Reused summaries go to rendering/TTS before any model is loaded
+        waiting = {}  # original chunk -> its duplicates still without a summary
+        for i, summary in enumerate(slide_summaries):
+            if summary is not None:
+                summary_ready(i, summary)
+        for i in duplicates:
+            if slide_summaries[duplicate_of[i]] is not None:
+                summary_ready(i, slide_summaries[duplicate_of[i]])
+            else:
+                waiting.setdefault(duplicate_of[i], []).append(i)
+        
+        if changed or overall_summary is None:
+            # Try using transformers if available
+            if summarizer is None:
+                summarizer = load_summarizer()
+            stream = summarizer.iter_chunk_summaries(
+                [chunks[i] for i in changed],
+                [token_ids[i] for i in changed] if token_ids is not None else None,
+                batch_size=batch_size)
+            for j, summary in stream:
+                summary_ready(changed[j], summary)
+                for i in waiting.pop(changed[j], []):
+                    summary_ready(i, summary)
+        for i in duplicates:
+            slide_summaries[i] = slide_summaries[duplicate_of[i]]
+        
+        unique_summaries = [summary for summary, original in zip(slide_summaries, duplicate_of)
+                            if original is None]
+        if overall_summary is None:
+            overall_summary = summarizer.overall_summary(unique_summaries, batch_size=batch_size)
+        
+        print(f"   AI Summarization: Created {len(slide_summaries)} slide summaries "
+              f"({len(chunks) - len(changed) - len(duplicates)} reused)")
+        n_duplicates = sum(original is not None for original in duplicate_of)
+        if n_duplicates:
+            print(f"   Near-duplicate chunks: {n_duplicates} "
+                  f"({len(duplicates)} model calls avoided)")
+        if summarizer is not None:
+            from pdf2lecture.models import get_registry
+            for model_stats in get_registry().stats():
+                print(f"   Model {model_stats['name']}: loaded in {model_stats['load_seconds']:.1f}s, "
+                      f"{model_stats['bytes'] / 1024 / 1024:.0f} MB, used {model_stats['uses']}x")
+        if summary_cache is not None and summarizer is not None and summary_workers <= 1:
+            print(f"   Summary cache: {summary_cache.hits} hits, {summary_cache.misses} misses")
+        for chunk, summary in zip(chunks, slide_summaries):
+            manifest.record_chunk(chunk, summary, summary_model)
+        manifest.record_overall_summary(chunks, overall_summary, summary_model)
+        
+        if dedupe == "drop" and n_duplicates:
+            slide_summaries = unique_summaries
+            print(f"   Dropped {n_duplicates} duplicate slides")
     except ImportError:
-        # Fallback to simple summarization
-        print("   AI summarization not available, using simple text chunking...")
-        slide_summaries = simple_summarize(raw_text)
-        overall_summary = "Summary generated using text chunking (AI summarization not available)"
-        print(f"   Simple Summarization: Created {len(slide_summaries)} slide summaries")
+        try:
+            # No model available: extractive TF-IDF summaries
+            from pdf2lecture.summarizer import ExtractiveSummarizer
+            print("   AI summarization not available, using extractive summarization...")
+            slide_summaries, overall_summary = ExtractiveSummarizer().hierarchical_summary(raw_text)
+            print(f"   Extractive Summarization: Created {len(slide_summaries)} slide summaries")
+        except ImportError:
+            # Fallback to simple summarization
+            print("   Extractive summarization not available (needs numpy), using simple text chunking...")
+            slide_summaries = simple_summarize(raw_text)
+            overall_summary = "Summary generated using text chunking (AI summarization not available)"
+            print(f"   Simple Summarization: Created {len(slide_summaries)} slide summaries")
+    finally:
+        if hasattr(summarizer, "close"):
+            summarizer.close()  # stop summarization worker processes
+    
+    # Anything not streamed above (fallback summaries, dropped duplicates
+    # shifting slide numbers) is submitted now; slides whose summary is
+    # unchanged keep their image and narration
+    for i, summary in enumerate(slide_summaries):
+        submit_slide(i, summary)
     
     # Save summaries
     summary_path = os.path.join(output_dir, "summaries.txt")
@@ -159,38 +404,82 @@ def run_pipeline(pdf_path: str, output_dir: str = "output",
         print(f"   WARNING: PowerPoint generation failed: {e}")
         results["pptx"] = None
     
+    slides_changed = len(slide_summaries) != len(manifest.previous.get("slides", []))
+    
     # Step 5: Slide Images
     print("\n[5/7] Generating slide images...")
     try:
-        from pdf2lecture.slides import create_slide_images
-        images_dir = os.path.join(output_dir, "slide_images")
-        slide_images = create_slide_images(slide_summaries, output_dir=images_dir)
-        print(f"   Created {len(slide_images)} slide images")
+        if render_error is not None:
+            raise render_error
+        slide_images = []
+        rendered = 0
+        for i, summary in enumerate(slide_summaries):
+            image_path, was_rendered = image_futures[i].result()
+            rendered += was_rendered
+            slide_images.append(image_path)
+            manifest.record_slide(i, summary, image=image_path)
+        slides_changed = slides_changed or rendered > 0
+        print(f"   Created {len(slide_images)} slide images ({rendered} rendered)")
         results["images"] = slide_images
     except ImportError as e:
         print(f"   WARNING: Slide image generation failed: {e}")
         results["images"] = []
+    finally:
+        render_pool.shutdown(wait=True)
     
     # Step 6: Text-to-Speech
+    # One clip per slide so unchanged slides keep their narration, then joined
     print("\n[6/7] Generating narration...")
     audio_path = os.path.join(output_dir, "narration.mp3")
     
     try:
-        from pdf2lecture.tts import group_texts_to_single_audio
-        group_texts_to_single_audio(slide_summaries, audio_path, method=use_tts)
-        print(f"   Saved: {audio_path}")
+        from pdf2lecture.tts import concatenate_audio, group_texts_to_single_audio
+        slide_audio = []
+        synthesized = 0
+        for i, summary in enumerate(slide_summaries):
+            if tts_pool is not None:
+                clip_path, was_synthesized = audio_futures[i].result()
+            else:
+                clip_path, was_synthesized = narrate_one(i, summary)
+            synthesized += was_synthesized
+            slide_audio.append(clip_path)
+            manifest.record_slide(i, summary, audio=clip_path, tts=use_tts)
+        slides_changed = slides_changed or synthesized > 0
+        
+        if slides_changed or not os.path.exists(audio_path):
+            try:
+                concatenate_audio(slide_audio, audio_path)
+            except Exception as e:
+                # Joining decodes the clips (pydub needs ffmpeg/ffprobe), and a
+                # failed clip may be an empty placeholder file
+                print(f"   Could not join slide clips ({e}); narrating all slides in one file")
+                group_texts_to_single_audio(slide_summaries, audio_path, method=use_tts)
+        print(f"   Saved: {audio_path} ({synthesized} of {len(slide_audio)} slides synthesized)")
         results["audio"] = audio_path
+        results["slide_audio"] = slide_audio
     except ImportError as e:
         print(f"   WARNING: TTS generation failed: {e}")
         results["audio"] = None
+    finally:
+        if tts_pool is not None:
+            tts_pool.shutdown(wait=True)
     
     # Step 7: Video Creation
     print("\n[7/7] Creating video lecture...")
-    if results.get("images") and results.get("audio"):
+    video_path = os.path.join(output_dir, "lecture.mp4")
+    if results.get("images") and results.get("audio") and not slides_changed \
+            and os.path.exists(video_path):
+        print("   No slides changed, keeping existing video")
+        results["video"] = video_path
+    elif results.get("images") and results.get("audio"):
         try:
-            from pdf2lecture.video import make_video_from_images_and_audio
-            video_path = os.path.join(output_dir, "lecture.mp4")
-            make_video_from_images_and_audio(results["images"], results["audio"], video_path)
+            if precise_timing and results.get("slide_audio"):
+                from pdf2lecture.video import make_video_with_precise_timing
+                make_video_with_precise_timing(results["images"], results["slide_audio"],
+                                               video_path)
+            else:
+                from pdf2lecture.video import make_video_from_images_and_audio
+                make_video_from_images_and_audio(results["images"], results["audio"], video_path)
             print(f"   Saved: {video_path}")
             results["video"] = video_path
         except ImportError as e:
@@ -200,6 +489,8 @@ def run_pipeline(pdf_path: str, output_dir: str = "output",
         print("   Skipping video creation (missing images or audio)")
         results["video"] = None
     
+    manifest.save()
+    
     print("\n" + "=" * 60)
     print("PROCESSING COMPLETE!")
     print("=" * 60)
@@ -223,6 +514,7 @@ Examples:
   %(prog)s document.pdf
   %(prog)s lecture.pdf --out my_lecture --tts pyttsx3
   %(prog)s paper.pdf --model "sshleifer/distilbart-cnn-12-6"
+  %(prog)s textbook.pdf --pages 120-180
         """
     )
     
@@ -233,10 +525,54 @@ Examples:
                        help="Text-to-speech engine (default: gtts)")
     parser.add_argument("--model", "-m", default="facebook/bart-large-cnn",
                        help="Summarization model name (default: facebook/bart-large-cnn)")
+    parser.add_argument("--backend", choices=["pytorch", "int8", "onnx"], default="pytorch",
+                       help="Inference backend: fp32 PyTorch, int8 dynamic quantization, or ONNX Runtime (default: pytorch)")
+    parser.add_argument("--assistant-model", default=None,
+                       help="Draft model for assisted decoding, e.g. sshleifer/distilbart-cnn-12-6; output matches greedy --model (pytorch backend, not with --time-budget)")
+    parser.add_argument("--chunk-mode", choices=["chars", "tokens"], default="chars",
+                       help="Chunk by characters, or pack chunks up to the model's token limit (default: chars)")
+    parser.add_argument("--time-budget", type=float, default=None,
+                       help="Seconds for summarization; chunks are assigned to --model, distilbart or extractive to meet it")
+    parser.add_argument("--summary-workers", type=int, default=1,
+                       help="Summarization worker processes, each with its own model copy (default: 1)")
+    parser.add_argument("--batch-size", type=int, default=1,
+                       help="Chunks summarized per model call, bucketed by length (default: 1)")
+    parser.add_argument("--dedupe", choices=["reuse", "drop", "off"], default="reuse",
+                       help="Near-duplicate chunks: reuse the first summary, drop the slide, or summarize anyway (default: reuse)")
+    parser.add_argument("--dedupe-threshold", type=float, default=0.9,
+                       help="SimHash similarity for near-duplicate chunks, 0-1 (default: 0.9)")
     parser.add_argument("--precise-timing", action="store_true",
                        help="Use precise per-slide audio timing")
     parser.add_argument("--test-deps", action="store_true",
                        help="Test dependencies before running")
+    parser.add_argument("--pages", default=None,
+                       help="Pages to use, e.g. 120-180 or 1-5,9 (default: all)")
+    parser.add_argument("--max-pages", type=int, default=None,
+                       help="Use at most this many pages")
+    parser.add_argument("--sample", type=int, default=None,
+                       help="Use this many evenly spaced pages")
+    parser.add_argument("--ocr", action="store_true",
+                       help="OCR pages without a text layer (needs pytesseract + tesseract)")
+    parser.add_argument("--ocr-dpi", type=int, default=200,
+                       help="Rasterization DPI for OCR (default: 200)")
+    parser.add_argument("--ocr-workers", type=int, default=None,
+                       help="Maximum OCR processes (default: min(4, CPU count))")
+    parser.add_argument("--force", action="store_true",
+                       help="Reprocess everything instead of reusing unchanged parts of the previous run")
+    parser.add_argument("--cache-dir", default=None,
+                       help="Extraction cache directory (default: $PDF2LECTURE_CACHE_DIR or ~/.cache/pdf2lecture)")
+    parser.add_argument("--cache-max-mb", type=int, default=512,
+                       help="Extraction cache size limit in MB (default: 512)")
+    parser.add_argument("--summary-cache-dir", default=None,
+                       help="Summary cache directory, e.g. on a volume shared between machines (default: --cache-dir)")
+    parser.add_argument("--summary-cache-max-mb", type=int, default=256,
+                       help="Summary cache size limit in MB (default: 256)")
+    parser.add_argument("--shared-cache", action="store_true",
+                       help="Make cache entries group-writable so several machines or users can share the directory")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Disable the extraction and summary caches")
+    parser.add_argument("--cache-stats", action="store_true",
+                       help="Print cache statistics after the run")
     
     args = parser.parse_args()
     
@@ -256,13 +592,39 @@ Examples:
                 print("Note: fitz is part of pymupdf. Install with: pip install pymupdf")
         print()
     
+    cache = None
+    summary_cache = None
+    if not args.no_cache:
+        cache = ExtractionCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024,
+                                shared=args.shared_cache)
+        summary_cache = SummaryCache(args.summary_cache_dir or args.cache_dir,
+                                     max_bytes=args.summary_cache_max_mb * 1024 * 1024,
+                                     shared=args.shared_cache)
+    
     try:
         results = run_pipeline(
             pdf_path=args.pdf_file,
             output_dir=args.out,
             use_tts=args.tts,
             model_name=args.model,
-            precise_timing=args.precise_timing
+            precise_timing=args.precise_timing,
+            cache=cache,
+            pages=args.pages,
+            max_pages=args.max_pages,
+            sample=args.sample,
+            ocr=args.ocr,
+            ocr_dpi=args.ocr_dpi,
+            ocr_workers=args.ocr_workers,
+            incremental=not args.force,
+            chunk_mode=args.chunk_mode,
+            dedupe=args.dedupe,
+            dedupe_threshold=args.dedupe_threshold,
+            batch_size=args.batch_size,
+            summary_cache=summary_cache,
+            backend=args.backend,
+            summary_workers=args.summary_workers,
+            time_budget=args.time_budget,
+            assistant_model=args.assistant_model
         )
     except Exception as e:
         print(f"Error during processing: {e}")
@@ -272,6 +634,17 @@ Examples:
         print("3. Try a different PDF file")
         print("4. Use --tts pyttsx3 for offline TTS")
         sys.exit(1)
+    finally:
+        if args.cache_stats:
+            for label, disk_cache in (("Extraction", cache), ("Summary", summary_cache)):
+                if disk_cache is None:
+                    continue
+                stats = disk_cache.stats()
+                print(f"\n{label} cache ({stats['path']}):")
+                print(f"   Hits: {stats['hits']}  Misses: {stats['misses']}  "
+                      f"Hit rate: {stats['hit_rate']:.0%}")
+                print(f"   Entries: {stats['entries']}  "
+                      f"Size: {stats['bytes'] / 1024 / 1024:.1f} / {stats['max_bytes'] / 1024 / 1024:.0f} MB")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,8 +7,8 @@ PDF to Lecture Generator with AI Summarization
 import argparse
 import os
 
-def run_ai_pipeline(pdf_path: str, output_dir: str = "ai_output"):
-    """Pipeline with AI summarization"""
+def run_ai_pipeline(pdf_path: str, output_dir: str = "ai_output", time_budget: float = 60.0):
+    """Pipeline with AI summarization, finishing summarization within time_budget seconds"""
     os.makedirs(output_dir, exist_ok=True)
     
     print("=" * 60)
@@ -30,25 +30,17 @@ def run_ai_pipeline(pdf_path: str, output_dir: str = "ai_output"):
     # Step 2: AI Summarization
     print("\n[2/6] AI Summarization...")
     try:
-        from transformers import pipeline
+        from pdf2lecture.scheduler import BudgetedSummarizer, DEFAULT_TIERS
         
-        # Use a smaller, faster model for summarization
-        summarizer = pipeline("summarization", 
-                            model="sshleifer/distilbart-cnn-12-6",
-                            tokenizer="sshleifer/distilbart-cnn-12-6")
+        # Use the smaller, faster model, or extractive summaries for the
+        # chunks it cannot reach in time
+        summarizer = BudgetedSummarizer(time_budget, tiers=DEFAULT_TIERS[1:])
         
         # Split text into chunks for summarization
         from pdf2lecture.utils import chunk_text
         chunks = chunk_text(cleaned_text, max_chars=1000)
         
-        summaries = []
-        for i, chunk in enumerate(chunks[:5]):  # Limit to 5 chunks for speed
-            print(f"   Summarizing chunk {i+1}/{len(chunks[:5])}")
-            if len(chunk) > 50:
-                summary = summarizer(chunk, max_length=120, min_length=30, do_sample=False)[0]['summary_text']
-                summaries.append(summary)
-            else:
-                summaries.append(chunk)  # Keep short chunks as-is
+        summaries = summarizer.summarize_chunk_list(chunks)
         
         print(f"   Created {len(summaries)} AI summaries")
         
@@ -121,6 +113,8 @@ def main():
     parser = argparse.ArgumentParser(description="AI PDF to Lecture Generator")
     parser.add_argument("pdf_file", help="PDF file to process")
     parser.add_argument("--out", default="ai_output", help="Output directory")
+    parser.add_argument("--time-budget", type=float, default=60.0,
+                       help="Seconds allowed for summarization (default: 60)")
     
     args = parser.parse_args()
     
@@ -128,7 +122,7 @@ def main():
         print(f"Error: PDF file '{args.pdf_file}' not found")
         return
     
-    run_ai_pipeline(args.pdf_file, args.out)
+    run_ai_pipeline(args.pdf_file, args.out, time_budget=args.time_budget)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -45,19 +45,23 @@ def run_working_pipeline(pdf_path: str, output_dir: str = "working_output"):
     
     # Step 3: Simple Summarization
     print("\n[3/6] Creating slides...")
-    from pdf2lecture.utils import chunk_text
+    from pdf2lecture.utils import chunk_text, sentence_spans
     chunks = chunk_text(cleaned_text, max_chars=800)
     slides = chunks[:10]  # Limit to 10 slides
     
-    # Simple summarization
-    summaries = []
-    for chunk in slides:
-        sentences = chunk.split('.')
-        if len(sentences) > 1:
-            summary = sentences[0] + '.'
-        else:
-            summary = chunk[:150] + '...' if len(chunk) > 150 else chunk
-        summaries.append(summary)
+    # Most representative sentence of each chunk (TF-IDF centroid), no model needed
+    try:
+        from pdf2lecture.summarizer import ExtractiveSummarizer
+        summaries = ExtractiveSummarizer(sentences_per_chunk=1).summarize_chunk_list(slides)
+    except ImportError:
+        summaries = []
+        for chunk in slides:
+            spans = sentence_spans(chunk)
+            if len(spans) > 1:
+                summary = chunk[spans[0][0]:spans[0][1]]
+            else:
+                summary = chunk[:150] + '...' if len(chunk) > 150 else chunk
+            summaries.append(summary)
     
     print(f"   Created {len(summaries)} slides")
     
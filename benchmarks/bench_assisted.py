@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: assisted (draft-model) decoding against plain greedy decoding.
+
+bart-large-cnn summarizes each chunk greedily, then again with distilbart
+proposing tokens. Reports wall time and speedup, draft acceptance rate
+(accepted draft tokens / proposed draft tokens), tokens per main-model
+forward pass, and whether the outputs are identical. Beam search, the
+model's default decoding, is timed for reference.
+
+Usage:
+    python benchmarks/bench_assisted.py                     # examples/*.pdf
+    python benchmarks/bench_assisted.py lecture.pdf --max-chunks 8
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pdf2lecture.extractor import extract_text
+from pdf2lecture.summarizer import Summarizer
+from pdf2lecture.utils import chunk_text, clean_whitespace
+
+class CallCounter:
+    """Counts forward passes of a model through a forward pre-hook."""
+
+    def __init__(self, model):
+        self.calls = 0
+        model.register_forward_pre_hook(self._hook)
+
+    def _hook(self, module, args):
+        self.calls += 1
+
+def timed(func, **kwargs):
+    start = time.perf_counter()
+    result = func(**kwargs)
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark assisted decoding")
+    parser.add_argument("pdf_files", nargs="*",
+                        default=sorted(glob.glob(os.path.join(ROOT, "examples", "*.pdf"))))
+    parser.add_argument("--model", default="facebook/bart-large-cnn")
+    parser.add_argument("--assistant", default="sshleifer/distilbart-cnn-12-6")
+    parser.add_argument("--max-chunks", type=int, default=16)
+    parser.add_argument("--no-beam", action="store_true", help="Skip the beam search reference")
+    args = parser.parse_args()
+
+    import torch
+
+    chunks = []
+    for pdf_file in args.pdf_files:
+        chunks.extend(chunk_text(clean_whitespace(extract_text(pdf_file)), max_chars=1200))
+    chunks = chunks[:args.max_chunks]
+    print(f"{len(chunks)} chunks from {len(args.pdf_files)} PDFs\n")
+
+    summarizer = Summarizer(model_name=args.model, assistant_model=args.assistant)
+    if summarizer.assistant is None:
+        sys.exit("Assistant model could not be used; nothing to compare")
+    model, draft = summarizer.pipeline.model, summarizer.assistant
+    model_calls, draft_calls = CallCounter(model), CallCounter(draft)
+    settings = {"max_length": 150, "min_length": 30, "do_sample": False}
+
+    totals = {"greedy": 0.0, "assisted": 0.0, "beam": 0.0, "tokens": 0,
+              "steps": 0, "proposed": 0, "accepted": 0, "identical": 0}
+    print(f"{'chunk':>5}{'tokens':>8}{'greedy s':>10}{'assisted s':>12}{'speedup':>9}"
+          f"{'accept':>8}{'tok/step':>10}{'same':>6}")
+    with torch.inference_mode():
+        for n, chunk in enumerate(chunks, 1):
+            inputs = summarizer.tokenizer(chunk, truncation=True, return_tensors="pt")
+            greedy_time, greedy = timed(model.generate, **inputs, num_beams=1, **settings)
+
+            model_calls.calls = draft_calls.calls = 0
+            assisted_time, assisted = timed(model.generate, **inputs, num_beams=1,
+                                            assistant_model=draft, **settings)
+            tokens = assisted.shape[1] - 1  # minus the decoder start token
+            steps, proposed = model_calls.calls, draft_calls.calls
+            accepted = max(tokens - steps, 0)  # each step adds one token of its own
+
+            if not args.no_beam:
+                totals["beam"] += timed(model.generate, **inputs, **settings)[0]
+            same = greedy.shape == assisted.shape and bool(torch.equal(greedy, assisted))
+
+            totals["greedy"] += greedy_time
+            totals["assisted"] += assisted_time
+            totals["tokens"] += tokens
+            totals["steps"] += steps
+            totals["proposed"] += proposed
+            totals["accepted"] += accepted
+            totals["identical"] += same
+            print(f"{n:>5}{tokens:>8}{greedy_time:>10.2f}{assisted_time:>12.2f}"
+                  f"{greedy_time / assisted_time:>9.2f}{accepted / max(proposed, 1):>8.2f}"
+                  f"{tokens / max(steps, 1):>10.2f}{str(same):>6}")
+
+    print(f"\nGreedy:   {totals['greedy']:.1f}s")
+    print(f"Assisted: {totals['assisted']:.1f}s "
+          f"({totals['greedy'] / max(totals['assisted'], 1e-9):.2f}x)")
+    if not args.no_beam:
+        print(f"Beam (model default): {totals['beam']:.1f}s")
+    print(f"Acceptance rate: {totals['accepted'] / max(totals['proposed'], 1):.2f} "
+          f"({totals['accepted']} of {totals['proposed']} draft tokens)")
+    print(f"Tokens per {args.model} forward pass: "
+          f"{totals['tokens'] / max(totals['steps'], 1):.2f}")
+    print(f"Identical to greedy: {totals['identical']} of {len(chunks)} chunks")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Summarizer inference backends on CPU.
+
+Each backend runs in a fresh process, so peak memory is measured
+independently. Reports load time, per-chunk latency, peak RSS, weight size
+and ROUGE-1 / ROUGE-L F1 of each backend's summaries against fp32 PyTorch.
+
+Usage:
+    python benchmarks/bench_backends.py                     # examples/*.pdf
+    python benchmarks/bench_backends.py lecture.pdf --backends pytorch int8 onnx
+"""
+
+import argparse
+import glob
+import multiprocessing
+import os
+import re
+import resource
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pdf2lecture.extractor import extract_text
+from pdf2lecture.utils import chunk_text, clean_whitespace
+
+def run_backend(backend: str, model_name: str, chunks: list) -> dict:
+    """Load one backend and summarize every chunk (runs in a child process)."""
+    from pdf2lecture.summarizer import Summarizer
+
+    start = time.perf_counter()
+    summarizer = Summarizer(model_name=model_name, backend=backend)
+    load_seconds = time.perf_counter() - start
+
+    latencies = []
+    summaries = []
+    for chunk in chunks:
+        start = time.perf_counter()
+        summaries.append(summarizer.summarize_chunk(chunk))
+        latencies.append(time.perf_counter() - start)
+
+    from pdf2lecture.models import get_registry
+    weights = sum(stats["bytes"] for stats in get_registry().stats())
+    return {
+        "load_seconds": load_seconds,
+        "latencies": latencies,
+        "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,  # KB on Linux
+        "weights": weights,
+        "summaries": summaries,
+    }
+
+def tokens(text: str) -> list:
+    return re.findall(r"\w+", text.lower())
+
+def f1(overlap: int, candidate: int, reference: int) -> float:
+    if not overlap:
+        return 0.0
+    precision, recall = overlap / candidate, overlap / reference
+    return 2 * precision * recall / (precision + recall)
+
+def rouge_1(candidate: str, reference: str) -> float:
+    cand, ref = tokens(candidate), tokens(reference)
+    counts = {}
+    for word in ref:
+        counts[word] = counts.get(word, 0) + 1
+    overlap = 0
+    for word in cand:
+        if counts.get(word, 0) > 0:
+            counts[word] -= 1
+            overlap += 1
+    return f1(overlap, len(cand), len(ref))
+
+def rouge_l(candidate: str, reference: str) -> float:
+    cand, ref = tokens(candidate), tokens(reference)
+    previous = [0] * (len(ref) + 1)
+    for word in cand:
+        current = [0]
+        for j, other in enumerate(ref, 1):
+            current.append(previous[j - 1] + 1 if word == other else max(previous[j], current[-1]))
+        previous = current
+    return f1(previous[-1], len(cand), len(ref))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CPU inference backends")
+    parser.add_argument("pdf_files", nargs="*",
+                        default=sorted(glob.glob(os.path.join(ROOT, "examples", "*.pdf"))))
+    parser.add_argument("--model", default="facebook/bart-large-cnn")
+    parser.add_argument("--backends", nargs="+", default=["pytorch", "int8", "onnx"])
+    parser.add_argument("--max-chunks", type=int, default=16)
+    args = parser.parse_args()
+
+    chunks = []
+    for pdf_file in args.pdf_files:
+        chunks.extend(chunk_text(clean_whitespace(extract_text(pdf_file)), max_chars=1200))
+    chunks = chunks[:args.max_chunks]
+    print(f"{len(chunks)} chunks from {len(args.pdf_files)} PDFs, model {args.model}\n")
+
+    backends = ["pytorch"] + [b for b in args.backends if b != "pytorch"]
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for backend in backends:
+        with context.Pool(1) as pool:
+            try:
+                results[backend] = pool.apply(run_backend, (backend, args.model, chunks))
+            except Exception as e:
+                print(f"{backend}: failed ({e})")
+
+    reference = results.get("pytorch")
+    print(f"\n{'backend':<10}{'load s':>8}{'mean s':>8}{'p95 s':>8}{'peak RSS MB':>13}"
+          f"{'weights MB':>12}{'ROUGE-1':>9}{'ROUGE-L':>9}")
+    for backend, result in results.items():
+        latencies = sorted(result["latencies"]) or [0.0]
+        mean = sum(latencies) / len(latencies)
+        p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+        if reference and backend != "pytorch":
+            pairs = list(zip(result["summaries"], reference["summaries"]))
+            r1 = sum(rouge_1(c, r) for c, r in pairs) / max(len(pairs), 1)
+            rl = sum(rouge_l(c, r) for c, r in pairs) / max(len(pairs), 1)
+            drift = f"{r1:>9.3f}{rl:>9.3f}"
+        else:
+            drift = f"{'ref':>9}{'ref':>9}"
+        print(f"{backend:<10}{result['load_seconds']:>8.1f}{mean:>8.2f}{p95:>8.2f}"
+              f"{result['peak_rss'] / 1024 / 1024:>13.0f}{result['weights'] / 1024 / 1024:>12.0f}{drift}")
+
+if __name__ == "__main__":
+    main()
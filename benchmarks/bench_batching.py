@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: summarization throughput at different batch sizes.
+
+Batch size 1 is the one-chunk-per-call loop; larger sizes go through
+Summarizer.summarize_batched (length-bucketed, padded generate() calls).
+
+Usage:
+    python benchmarks/bench_batching.py lecture.pdf --batch-sizes 1 4 8 16 --max-chunks 64
+    python benchmarks/bench_batching.py notes.txt --model sshleifer/distilbart-cnn-12-6
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf2lecture.extractor import extract_text
+from pdf2lecture.summarizer import Summarizer
+from pdf2lecture.utils import chunk_text, clean_whitespace
+
+def load_text(path: str) -> str:
+    if path.lower().endswith(".pdf"):
+        return extract_text(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched summarization")
+    parser.add_argument("source", help="PDF or text file (50+ chunks is most meaningful)")
+    parser.add_argument("--model", default="facebook/bart-large-cnn")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--max-chars", type=int, default=1200)
+    parser.add_argument("--max-chunks", type=int, default=64)
+    args = parser.parse_args()
+
+    chunks = chunk_text(clean_whitespace(load_text(args.source)), max_chars=args.max_chars)
+    chunks = chunks[:args.max_chunks]
+    summarizer = Summarizer(model_name=args.model)
+    input_tokens = sum(len(ids) for ids in summarizer.tokenizer(chunks, truncation=True)["input_ids"])
+    print(f"{len(chunks)} chunks, {input_tokens} input tokens, model {args.model}\n")
+
+    baseline = None
+    rows = []
+    for batch_size in args.batch_sizes:
+        start = time.perf_counter()
+        summaries = summarizer.summarize_chunk_list(chunks, batch_size=batch_size)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = (elapsed, summaries)
+        same = sum(a == b for a, b in zip(summaries, baseline[1]))
+        rows.append((batch_size, elapsed, input_tokens / elapsed, baseline[0] / elapsed, same))
+
+    print(f"\n{'batch':>6}{'seconds':>10}{'tokens/s':>11}{'speedup':>9}{'same as first':>15}")
+    for batch_size, elapsed, rate, speedup, same in rows:
+        print(f"{batch_size:>6}{elapsed:>10.1f}{rate:>11.1f}{speedup:>9.2f}{same:>10}/{len(chunks)}")
+
+if __name__ == "__main__":
+    main()
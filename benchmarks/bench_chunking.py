@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: chunk_text on multi-megabyte inputs without paragraph breaks,
+against the previous implementation that re-joined the word list per word.
+
+Usage:
+    python benchmarks/bench_chunking.py --megabytes 1 4 --max-chars 1200
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf2lecture.utils import chunk_text, iter_chunks
+
+def chunk_text_rejoin(text: str, max_chars: int = 1200) -> list:
+    """Previous chunk_text, kept here as the baseline."""
+    paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+    chunks = []
+    current_chunk = ""
+    for paragraph in paragraphs:
+        if len(current_chunk) + len(paragraph) + 2 <= max_chars:
+            current_chunk = current_chunk + "\n\n" + paragraph if current_chunk else paragraph
+        else:
+            if current_chunk:
+                chunks.append(current_chunk)
+            if len(paragraph) <= max_chars:
+                current_chunk = paragraph
+            else:
+                current_words = []
+                for word in paragraph.split():
+                    if len(' '.join(current_words + [word])) <= max_chars:
+                        current_words.append(word)
+                    else:
+                        if current_words:
+                            chunks.append(' '.join(current_words))
+                        current_words = [word]
+                if current_words:
+                    chunks.append(' '.join(current_words))
+                current_chunk = ""
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+def make_text(megabytes: float, seed: int = 0) -> str:
+    """One giant paragraph, like pdfplumber output with no blank lines."""
+    rng = random.Random(seed)
+    vocab = ["lecture", "neural", "a", "of", "gradient", "descent", "is", "the",
+             "optimization", "model", "x", "data", "learning", "rate", "2.5"]
+    words = []
+    size = 0
+    target = int(megabytes * 1024 * 1024)
+    while size < target:
+        word = rng.choice(vocab)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark text chunking")
+    parser.add_argument("--megabytes", type=float, nargs="+", default=[1, 4])
+    parser.add_argument("--max-chars", type=int, default=1200)
+    args = parser.parse_args()
+
+    print(f"{'size':>8}{'rejoin (s)':>13}{'chunk_text (s)':>16}{'iter_chunks (s)':>17}"
+          f"{'speedup':>10}{'same':>7}")
+    for megabytes in args.megabytes:
+        text = make_text(megabytes)
+        old_time, old_chunks = timed(chunk_text_rejoin, text, args.max_chars)
+        new_time, new_chunks = timed(chunk_text, text, args.max_chars)
+        stream_time, stream_chunks = timed(lambda t, m: list(iter_chunks(t, m)),
+                                           text, args.max_chars)
+        same = old_chunks == new_chunks == stream_chunks
+        print(f"{megabytes:>6.1f}MB{old_time:>13.3f}{new_time:>16.3f}{stream_time:>17.3f}"
+              f"{old_time / new_time:>10.1f}{str(same):>7}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark: serial vs. parallel PDF text extraction.
+
+Usage:
+    python benchmarks/bench_extraction.py book.pdf --workers 2 4 8 --chunk-size 16
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf2lecture.extractor import (extract_text_fitz, extract_text_parallel,
+                                   extract_text_pdfplumber)
+
+def time_call(func, *args, repeat: int = 1, **kwargs):
+    """Return (best wall time in seconds, result) over `repeat` runs."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel text extraction")
+    parser.add_argument("pdf_file", help="PDF to extract (larger is more meaningful)")
+    parser.add_argument("--method", choices=["pdfplumber", "fitz"], default="pdfplumber")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1])
+    parser.add_argument("--chunk-size", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    serial = extract_text_fitz if args.method == "fitz" else extract_text_pdfplumber
+    serial_time, serial_text = time_call(serial, args.pdf_file, repeat=args.repeat)
+    print(f"{'mode':<22}{'seconds':>10}{'speedup':>10}{'same text':>11}")
+    print(f"{'serial':<22}{serial_time:>10.3f}{1.0:>10.2f}{'-':>11}")
+
+    for workers in sorted(set(args.workers)):
+        elapsed, text = time_call(extract_text_parallel, args.pdf_file, method=args.method,
+                                  workers=workers, chunk_size=args.chunk_size,
+                                  repeat=args.repeat)
+        label = f"parallel x{workers}"
+        print(f"{label:<22}{elapsed:>10.3f}{serial_time / elapsed:>10.2f}"
+              f"{str(text == serial_text):>11}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: shared sentence segmenter vs. the ad hoc str.split('.') it replaced.
+
+Segments every chunk of a synthetic multi-megabyte corpus once (cold), then
+again as a later stage would (warm, served from the per-chunk cache).
+
+Usage:
+    python benchmarks/bench_sentences.py --megabytes 4 --max-chars 1200
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf2lecture.utils import chunk_text, sentence_spans
+
+SENTENCES = [
+    "The learning rate was set to 2.5 for all runs.",
+    "Dr. Smith et al. report similar results in Fig. 3.",
+    "Gradient descent converges, i.e. the loss stops decreasing.",
+    "Why does the model overfit?",
+    "Regularization helps!",
+    "See Sec. 4.2 for the derivation of the update rule.",
+    "J. K. Turing proposed the test in 1950.",
+]
+
+def make_corpus(megabytes: float, seed: int = 0):
+    """Return (text, true sentence count)."""
+    rng = random.Random(seed)
+    target = int(megabytes * 1024 * 1024)
+    paragraphs = []
+    sentences = 0
+    size = 0
+    while size < target:
+        count = rng.randint(3, 8)
+        paragraph = " ".join(rng.choice(SENTENCES) for _ in range(count))
+        paragraphs.append(paragraph)
+        sentences += count
+        size += len(paragraph) + 2
+    return "\n\n".join(paragraphs), sentences
+
+def split_naive(chunk: str) -> list:
+    return [s.strip() for s in chunk.split('.') if s.strip()]
+
+def timed(func, chunks):
+    start = time.perf_counter()
+    count = sum(len(func(chunk)) for chunk in chunks)
+    return time.perf_counter() - start, count
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sentence segmentation")
+    parser.add_argument("--megabytes", type=float, default=4)
+    parser.add_argument("--max-chars", type=int, default=1200)
+    args = parser.parse_args()
+
+    corpus, expected = make_corpus(args.megabytes)
+    chunks = chunk_text(corpus, max_chars=args.max_chars)
+
+    sentence_spans.cache_clear()
+    naive_time, naive_count = timed(split_naive, chunks)
+    cold_time, cold_count = timed(sentence_spans, chunks)
+    warm_time, warm_count = timed(sentence_spans, chunks)
+
+    print(f"{len(chunks)} chunks, {args.megabytes:.1f} MB, {expected} true sentences")
+    print(f"{'method':<26}{'seconds':>10}{'sentences':>12}")
+    print(f"{'str.split(.)':<26}{naive_time:>10.3f}{naive_count:>12}")
+    print(f"{'sentence_spans (cold)':<26}{cold_time:>10.3f}{cold_count:>12}")
+    print(f"{'sentence_spans (cached)':<26}{warm_time:>10.3f}{warm_count:>12}")
+    print(f"cache: {sentence_spans.cache_info()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+# pdf2lecture/cache.py
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from typing import Optional
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pdf2lecture")
+
+def default_cache_dir() -> str:
+    """
+    Cache root, overridable with the PDF2LECTURE_CACHE_DIR environment variable.
+    """
+    return os.environ.get("PDF2LECTURE_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+def file_hash(pdf_path: str, block_size: int = 1 << 20) -> str:
+    """
+    SHA-256 of a file's contents, read in blocks.
+    """
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def content_hash(source) -> str:
+    """
+    SHA-256 of a PDF given as a path, bytes-like object or binary file object.
+    
+    File objects are read in blocks and rewound afterwards.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return file_hash(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(source).hexdigest()
+    
+    digest = hashlib.sha256()
+    source.seek(0)
+    for block in iter(lambda: source.read(1 << 20), b""):
+        digest.update(block)
+    source.seek(0)
+    return digest.hexdigest()
+
+@lru_cache(maxsize=None)
+def engine_version(engine: str) -> str:
+    """
+    Version string of an extraction engine, so upgrades invalidate old entries.
+    """
+    try:
+        if engine == "fitz":
+            import fitz
+            return getattr(fitz, "VersionBind", "unknown")
+        if engine == "pdfplumber":
+            import pdfplumber
+            return getattr(pdfplumber, "__version__", "unknown")
+        if engine == "tesseract":
+            import pytesseract
+            return str(pytesseract.get_tesseract_version())
+    except Exception:
+        pass
+    return "unknown"
+
+class DiskCache:
+    """
+    Content-addressed on-disk cache with size-based LRU eviction.
+
+    Entries live in a sharded directory (<root>/<namespace>/ab/abcdef...),
+    one file per key. Writes go through a temp file and os.replace, so
+    readers never see partial entries. A hit refreshes the entry's mtime,
+    and eviction removes the least recently used files first.
+
+    Because writes are atomic and eviction tolerates files disappearing
+    underneath it, several processes or machines can share one cache
+    directory (e.g. on a mounted volume); pass shared=True so entries are
+    readable and writable by the whole group rather than only their creator.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, namespace: str = "default",
+                 max_bytes: int = 512 * 1024 * 1024, shared: bool = False):
+        """
+        Args:
+            cache_dir: Cache root (default: default_cache_dir())
+            namespace: Subdirectory separating different kinds of entries
+            max_bytes: Size limit before least recently used entries are evicted
+            shared: Make entries and shards group-writable for a shared volume
+        """
+        self.cache_dir = os.path.join(cache_dir or default_cache_dir(), namespace)
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self.hits = 0
+        self.misses = 0
+        self._size = None  # bytes on disk, computed on first write
+        self._makedirs(self.cache_dir)
+
+    def _makedirs(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        if self.shared:
+            try:
+                os.chmod(path, 0o2775)  # setgid: new shards keep the group
+            except PermissionError:
+                pass  # created by another user, who already set the mode
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], digest)
+
+    def _entries(self):
+        """Yield (path, size, mtime) for every entry on disk."""
+        for shard in os.listdir(self.cache_dir):
+            shard_dir = os.path.join(self.cache_dir, shard)
+            if not os.path.isdir(shard_dir):
+                continue
+            for name in os.listdir(shard_dir):
+                if name.startswith("."):
+                    continue  # in-flight temp file
+                path = os.path.join(shard_dir, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, st.st_size, st.st_mtime
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+        except (FileNotFoundError, PermissionError):
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass  # e.g. entry owned by another user on a shared volume
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes):
+        """Store value under key, evicting old entries if over the size limit."""
+        path = self._path(key)
+        self._makedirs(os.path.dirname(path))
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            if self.shared:
+                os.chmod(tmp_path, 0o664)  # mkstemp creates files as 0600
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size += len(value)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def get_json(self, key: str):
+        value = self.get(key)
+        return None if value is None else json.loads(value.decode("utf-8"))
+
+    def set_json(self, key: str, value):
+        self.set(key, json.dumps(value).encode("utf-8"))
+
+    def evict(self, target_bytes: Optional[int] = None) -> int:
+        """
+        Delete least recently used entries until the cache fits target_bytes
+        (default: 90% of max_bytes). Returns the number of entries removed.
+        """
+        if target_bytes is None:
+            target_bytes = int(self.max_bytes * 0.9)
+
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in entries:
+            if total <= target_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass  # already evicted by another process
+            except PermissionError:
+                continue  # not ours to delete
+            total -= size
+            removed += 1
+
+        self._size = total
+        return removed
+
+    def clear(self):
+        """Remove every entry."""
+        self.evict(target_bytes=0)
+
+    def stats(self) -> dict:
+        """Hit/miss counters for this session plus current on-disk usage."""
+        entries = list(self._entries())
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "path": self.cache_dir,
+        }
+
+class ExtractionCache(DiskCache):
+    """
+    Cache of extracted page text and document info, keyed by PDF content
+    hash, extraction engine and engine version, and page number.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 512 * 1024 * 1024,
+                 shared: bool = False):
+        super().__init__(cache_dir, namespace="extraction", max_bytes=max_bytes, shared=shared)
+
+    @staticmethod
+    def _page_key(pdf_hash: str, engine: str, page_num: int) -> str:
+        return f"page:{pdf_hash}:{engine}:{engine_version(engine)}:{page_num}"
+
+    def get_page(self, pdf_hash: str, engine: str, page_num: int) -> Optional[str]:
+        value = self.get(self._page_key(pdf_hash, engine, page_num))
+        return None if value is None else value.decode("utf-8")
+
+    def set_page(self, pdf_hash: str, engine: str, page_num: int, text: str):
+        self.set(self._page_key(pdf_hash, engine, page_num), text.encode("utf-8"))
+
+    def get_info(self, pdf_hash: str) -> Optional[dict]:
+        return self.get_json(f"info:{pdf_hash}")
+
+    def set_info(self, pdf_hash: str, info: dict):
+        self.set_json(f"info:{pdf_hash}", info)
+
+    def get_ocr(self, page_hash: str, lang: str) -> Optional[str]:
+        value = self.get(f"ocr:{page_hash}:{lang}:{engine_version('tesseract')}")
+        return None if value is None else value.decode("utf-8")
+
+    def set_ocr(self, page_hash: str, lang: str, text: str):
+        self.set(f"ocr:{page_hash}:{lang}:{engine_version('tesseract')}", text.encode("utf-8"))
+
+class SummaryCache(DiskCache):
+    """
+    Cache of chunk summaries, keyed by model (name and revision), the
+    generation settings, and a hash of the chunk text, so a chunk is only
+    ever summarized once per model configuration across runs.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 256 * 1024 * 1024,
+                 shared: bool = False):
+        super().__init__(cache_dir, namespace="summaries", max_bytes=max_bytes, shared=shared)
+
+    @staticmethod
+    def _key(model: str, settings: dict, text: str) -> str:
+        text_digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"summary:{model}:{json.dumps(settings, sort_keys=True)}:{text_digest}"
+
+    def get_summary(self, model: str, settings: dict, text: str) -> Optional[str]:
+        value = self.get(self._key(model, settings, text))
+        return None if value is None else value.decode("utf-8")
+
+    def set_summary(self, model: str, settings: dict, text: str, summary: str):
+        self.set(self._key(model, settings, text), summary.encode("utf-8"))
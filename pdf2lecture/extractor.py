@@ -1,13 +1,585 @@
 # pdf2lecture/extractor.py - FIXED IMPORTS
+import hashlib
+import importlib.util
+import io
 import os
-from typing import List
+import shutil
+import time
+import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 import pdfplumber
+from .cache import ExtractionCache, content_hash
+from .pdfplumber_extractor import PdfSource, open_pdf as open_pdfplumber
+from .utils import select_pages
 
-def extract_text(pdf_path: str, method: str = "pdfplumber") -> str:
+def _fitz_available() -> bool:
+    try:
+        import fitz
+        return True
+    except ImportError:
+        return False
+
+def pdf_buffer(pdf_path: PdfSource):
+    """
+    Bytes-like view of an in-memory PDF source, copying only when unavoidable.
+    
+    bytes/bytearray are returned as-is, a memoryview over a whole bytes
+    object returns that object, and file objects are read once.
+    """
+    if isinstance(pdf_path, (bytes, bytearray)):
+        return pdf_path
+    if isinstance(pdf_path, memoryview):
+        if isinstance(pdf_path.obj, bytes) and pdf_path.nbytes == len(pdf_path.obj):
+            return pdf_path.obj
+        return pdf_path.tobytes()
+    pdf_path.seek(0)
+    return pdf_path.read()
+
+def open_fitz(pdf_path: PdfSource):
+    """
+    Open a path, bytes-like object or binary file object with PyMuPDF.
+    """
+    import fitz
+    if isinstance(pdf_path, (str, os.PathLike)):
+        return fitz.open(pdf_path)
+    return fitz.open(stream=pdf_buffer(pdf_path), filetype="pdf")
+
+def looks_degenerate(text: str, min_chars: int = 20, max_bad_ratio: float = 0.05,
+                     min_alnum_ratio: float = 0.5) -> bool:
+    """
+    Heuristic check for unusable page text from a fast extractor.
+    
+    A page is degenerate if it has fewer than min_chars visible characters,
+    if too many characters are replacement/private-use/control code points
+    (a broken font encoding), or if too few visible characters are letters
+    or digits (garbled glyph mappings such as "!\"#$%&").
+    """
+    visible = [ch for ch in text if not ch.isspace()]
+    if len(visible) < min_chars:
+        return True
+    
+    bad = 0
+    alnum = 0
+    for ch in visible:
+        if ch.isalnum():
+            alnum += 1
+        elif ch == "\ufffd" or unicodedata.category(ch) in ("Co", "Cc", "Cs"):
+            bad += 1
+    
+    return bad / len(visible) > max_bad_ratio or alnum / len(visible) < min_alnum_ratio
+
+class PdfDocument:
+    """
+    A PDF opened once and shared by info, text and image extraction.
+    
+    Each engine (pdfplumber, PyMuPDF) parses the file at most once per
+    session, and extracted page text is kept so that a fallback or a second
+    pass does not re-extract it. Use as a context manager:
+    
+        with PdfDocument("lecture.pdf") as doc:
+            info = doc.info
+            text = doc.extract_text()
+            images = doc.extract_images("images")
+    
+    pdf_path may be a filesystem path, the PDF bytes (bytes, bytearray,
+    memoryview) or a binary file object such as a Streamlit upload.
+    
+    With an ExtractionCache, page text and info are looked up by content
+    hash first, and the engines are only opened for pages that miss.
+    
+    method="auto" extracts each page with PyMuPDF and falls back to
+    pdfplumber only for pages whose fitz text looks degenerate; the engine
+    that produced each page is recorded in page_engines.
+    
+    select_pages() restricts extraction to a page range or sample; only
+    those pages are parsed, and pdfplumber only builds their page objects.
+    """
+    
+    def __init__(self, pdf_path: PdfSource, cache: Optional[ExtractionCache] = None):
+        self.pdf_path = pdf_path
+        self.cache = cache
+        self._fitz_doc = None
+        self._plumber_pdf = None
+        self._page_texts = {}
+        self._info = None
+        self._content_hash = None
+        self.page_engines = {}
+        self.selected_pages = None  # 0-based indices, None = every page
+        self._page_overrides = {}  # page_num -> (text, engine)
+        self._resource_digests = {}  # xref -> digest of a shared image/XObject/font
+        self._plumber_index = {}
+    
+    def __enter__(self) -> "PdfDocument":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close any open engine handles."""
+        if self._fitz_doc is not None:
+            self._fitz_doc.close()
+            self._fitz_doc = None
+        if self._plumber_pdf is not None:
+            self._plumber_pdf.close()
+            self._plumber_pdf = None
+    
+    @property
+    def fitz_doc(self):
+        """PyMuPDF handle, opened on first use (raises ImportError if missing)."""
+        if self._fitz_doc is None:
+            self._fitz_doc = open_fitz(self.pdf_path)
+        return self._fitz_doc
+    
+    @property
+    def plumber_pdf(self):
+        """pdfplumber handle, opened on first use."""
+        if self._plumber_pdf is None:
+            if self.selected_pages is None:
+                self._plumber_pdf = open_pdfplumber(self.pdf_path)
+            else:
+                # pdfplumber only builds Page objects for the requested pages
+                self._plumber_pdf = open_pdfplumber(
+                    self.pdf_path, pages=[p + 1 for p in self.selected_pages])
+                self._plumber_index = {p: i for i, p in enumerate(self.selected_pages)}
+        return self._plumber_pdf
+    
+    def _plumber_page(self, page_num: int):
+        pdf = self.plumber_pdf
+        if self.selected_pages is None:
+            return pdf.pages[page_num]
+        return pdf.pages[self._plumber_index[page_num]]
+    
+    def select_pages(self, pages: Union[str, Iterable[int], None] = None,
+                     max_pages: Optional[int] = None,
+                     sample: Optional[int] = None) -> List[int]:
+        """
+        Restrict extraction to a page spec ("120-180"), 1-based page numbers,
+        the first max_pages pages and/or an evenly spaced sample of pages.
+        
+        Returns:
+            Selected 0-based page indices
+        """
+        selected = select_pages(self.page_count, pages, max_pages=max_pages, sample=sample)
+        if self._plumber_pdf is not None:
+            # Reopen so pdfplumber's page list matches the new selection
+            self._plumber_pdf.close()
+            self._plumber_pdf = None
+        self.selected_pages = selected
+        return selected
+    
+    @property
+    def page_numbers(self) -> Sequence[int]:
+        """0-based indices of the pages to extract."""
+        if self.selected_pages is not None:
+            return self.selected_pages
+        return range(self.page_count)
+    
+    def _resolve_method(self, method: str) -> str:
+        if method == "auto" and not _fitz_available():
+            return "pdfplumber"
+        if method == "fitz" and not _fitz_available():
+            print("PyMuPDF (fitz) not available, using pdfplumber")
+            return "pdfplumber"
+        return method
+    
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 of the PDF contents (the cache key)."""
+        if self._content_hash is None:
+            self._content_hash = content_hash(self.pdf_path)
+        return self._content_hash
+    
+    @property
+    def page_count(self) -> int:
+        """Number of pages, from whichever engine is already open (fitz preferred)."""
+        if self._info is not None or self.cache is not None:
+            return self.info["pages"]
+        return self._engine_page_count()
+    
+    def _engine_page_count(self) -> int:
+        if self._fitz_doc is not None or (self._plumber_pdf is None and _fitz_available()):
+            return len(self.fitz_doc)
+        # Read /Count from the page tree rather than building every Page object
+        from pdfminer.pdftypes import resolve1
+        return int(resolve1(self.plumber_pdf.doc.catalog["Pages"])["Count"])
+    
+    @property
+    def info(self) -> dict:
+        """Basic information about the PDF, same keys as get_pdf_info."""
+        if self._info is None and self.cache is not None:
+            self._info = self.cache.get_info(self.content_hash)
+        if self._info is None:
+            info = {"pages": self._engine_page_count(), "title": "", "author": "", "subject": ""}
+            if _fitz_available():
+                metadata = self.fitz_doc.metadata or {}
+                info["title"] = metadata.get("title", "")
+                info["author"] = metadata.get("author", "")
+                info["subject"] = metadata.get("subject", "")
+            else:
+                metadata = self.plumber_pdf.metadata or {}
+                info["title"] = metadata.get("Title", "")
+                info["author"] = metadata.get("Author", "")
+                info["subject"] = metadata.get("Subject", "")
+            self._info = info
+            if self.cache is not None:
+                self.cache.set_info(self.content_hash, info)
+        return self._info
+    
+    def page_text(self, page_num: int, method: str = "pdfplumber") -> str:
+        """
+        Stripped text of one page (0-based), extracted at most once per engine.
+        Pages recovered by ocr_missing_pages() or supplied through
+        set_page_text() return that text instead.
+        """
+        if page_num in self._page_overrides:
+            text, self.page_engines[page_num] = self._page_overrides[page_num]
+            return text
+        method = self._resolve_method(method)
+        if method == "auto":
+            return self._page_text_auto(page_num)
+        self.page_engines[page_num] = method
+        key = (method, page_num)
+        if key not in self._page_texts:
+            text = None
+            if self.cache is not None:
+                text = self.cache.get_page(self.content_hash, method, page_num)
+            if text is None:
+                if method == "fitz":
+                    text = self.fitz_doc.load_page(page_num).get_text("text")
+                else:
+                    text = self._plumber_page(page_num).extract_text()
+                text = text.strip() if text else ""
+                if self.cache is not None:
+                    self.cache.set_page(self.content_hash, method, page_num, text)
+            self._page_texts[key] = text
+        return self._page_texts[key]
+    
+    def set_page_text(self, page_num: int, text: str, engine: str):
+        """
+        Supply known text for a page (e.g. from a previous run) so it is
+        not extracted again.
+        """
+        self._page_overrides[page_num] = (text, engine)
+    
+    def page_hash(self, page_num: int) -> Optional[str]:
+        """
+        SHA-256 of a page's content, or None without PyMuPDF.
+        
+        Covers the page's content stream and size plus the objects and raw
+        streams of the images, Form XObjects and fonts it references, so a
+        replaced scan (the same "/Im0 Do" content stream) or text drawn
+        through a changed Form XObject changes the hash. Each shared
+        resource is hashed once per document and pages combine those
+        digests. Pages without fonts also hash a low-resolution rendering.
+        This is much cheaper than extracting text, so it is used to detect
+        which pages changed between PDF revisions.
+        """
+        if not _fitz_available():
+            return None
+        doc = self.fitz_doc
+        page = doc.load_page(page_num)
+        digest = hashlib.sha256(page.read_contents())
+        digest.update(repr(tuple(page.rect)).encode("ascii"))
+        
+        fonts = page.get_fonts(full=True)
+        font_xrefs = {item[0] for item in fonts}
+        xrefs = {item[0] for item in page.get_images(full=True)}
+        xrefs.update(item[0] for item in page.get_xobjects())
+        xrefs.update(font_xrefs)
+        for xref in sorted(xrefs):
+            if xref > 0:
+                digest.update(self._resource_digest(xref, xref in font_xrefs))
+        
+        if not fonts:
+            # Image-only page: also hash what it looks like
+            digest.update(page.get_pixmap(dpi=36).samples)
+        return digest.hexdigest()
+    
+    def _resource_digest(self, xref: int, is_font: bool) -> bytes:
+        """
+        Digest of one image, Form XObject or font, computed once per
+        document since fonts and logos are usually shared by many pages.
+        """
+        if xref not in self._resource_digests:
+            doc = self.fitz_doc
+            digest = hashlib.sha256(doc.xref_object(xref, compressed=True).encode("utf-8", "replace"))
+            if doc.xref_is_stream(xref):
+                digest.update(doc.xref_stream_raw(xref))
+            if is_font:
+                digest.update(doc.extract_font(xref)[-1] or b"")  # embedded font file
+            self._resource_digests[xref] = digest.digest()
+        return self._resource_digests[xref]
+    
+    def _page_text_auto(self, page_num: int) -> str:
+        """
+        PyMuPDF fast path with a per-page pdfplumber fallback.
+        """
+        text = self.page_text(page_num, "fitz")
+        if looks_degenerate(text):
+            fallback = self.page_text(page_num, "pdfplumber")
+            # Only switch if pdfplumber actually did better
+            if not looks_degenerate(fallback) or len(fallback) > len(text):
+                text = fallback
+            else:
+                self.page_engines[page_num] = "fitz"
+        return text
+    
+    def extract_pages(self, method: str = "auto") -> List[dict]:
+        """
+        Per-page extraction results.
+        
+        Returns:
+            List of {"page": 1-based page number, "text": str, "engine": str}
+        """
+        pages = []
+        for page_num in self.page_numbers:
+            text = self.page_text(page_num, method)
+            pages.append({"page": page_num + 1, "text": text,
+                          "engine": self.page_engines[page_num]})
+        return pages
+    
+    def iter_pages(self, method: str = "pdfplumber") -> Iterator[str]:
+        """Yield the text of each non-empty page in order."""
+        method = self._resolve_method(method)
+        for page_num in self.page_numbers:
+            text = self.page_text(page_num, method)
+            if text:
+                yield text
+    
+    def extract_text(self, method: str = "pdfplumber") -> str:
+        """Full document text, pages separated by blank lines."""
+        return "\n\n".join(self.iter_pages(method))
+    
+    def ocr_missing_pages(self, dpi: int = 200, workers: Optional[int] = None,
+                          lang: str = "eng") -> dict:
+        """
+        OCR the selected pages that have no text layer (requires PyMuPDF,
+        pytesseract and the tesseract binary).
+        
+        Pages are rasterized here with PyMuPDF and OCR'd in a process pool.
+        Results are cached by a hash of the rendered page image, so a
+        re-uploaded scan is only OCR'd once. Afterwards page_text() returns
+        the OCR text for those pages and page_engines records "ocr".
+        
+        Args:
+            dpi: Rasterization resolution
+            workers: Maximum OCR processes (default: min(4, CPU count))
+            lang: Tesseract language code(s), e.g. "eng" or "eng+deu"
+            
+        Returns:
+            {"pages": {page_number: {"chars", "seconds", "cached"[, "error"]}},
+             "total_seconds": float} with 1-based page numbers; pages whose
+            OCR failed have an "error" message and no text
+        """
+        workers = workers or min(4, os.cpu_count() or 1)
+        start = time.perf_counter()
+        report = {}
+        if not _fitz_available():
+            print("PyMuPDF (fitz) is required for OCR; skipping")
+            return {"pages": report, "total_seconds": 0.0}
+        if importlib.util.find_spec("pytesseract") is None or not shutil.which("tesseract"):
+            print("pytesseract and the tesseract binary are required for OCR; skipping")
+            return {"pages": report, "total_seconds": 0.0}
+        
+        # Pages supplied with text (e.g. reused from a previous run) are
+        # skipped, but not ones whose supplied text is empty
+        missing = [p for p in self.page_numbers if not self.page_text(p, "fitz")]
+        
+        def collect(future, page_num, page_hash):
+            try:
+                text, seconds = future.result()
+            except Exception as e:
+                print(f"OCR failed on page {page_num + 1}: {e}")
+                report[page_num + 1] = {"chars": 0, "seconds": 0.0, "cached": False,
+                                        "error": str(e)}
+                return
+            self._page_overrides[page_num] = (text, "ocr")
+            if self.cache is not None:
+                self.cache.set_ocr(page_hash, lang, text)
+            report[page_num + 1] = {"chars": len(text), "seconds": seconds, "cached": False}
+        
+        # The pool is only started once a page misses the OCR cache, and at
+        # most 2 x workers rendered pages are held in memory at a time
+        pool = None
+        in_flight = deque()
+        try:
+            for page_num in missing:
+                pixmap = self.fitz_doc.load_page(page_num).get_pixmap(dpi=dpi)
+                png_bytes = pixmap.tobytes("png")
+                page_hash = hashlib.sha256(png_bytes).hexdigest()
+                
+                text = None
+                if self.cache is not None:
+                    text = self.cache.get_ocr(page_hash, lang)
+                if text is not None:
+                    self._page_overrides[page_num] = (text, "ocr")
+                    report[page_num + 1] = {"chars": len(text), "seconds": 0.0, "cached": True}
+                    continue
+                
+                if pool is None:
+                    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_ocr_worker)
+                if len(in_flight) >= 2 * workers:
+                    collect(*in_flight.popleft())
+                in_flight.append((pool.submit(_ocr_image, png_bytes, lang), page_num, page_hash))
+            
+            while in_flight:
+                collect(*in_flight.popleft())
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        
+        return {"pages": report, "total_seconds": time.perf_counter() - start}
+    
+    def extract_image_manifest(self, output_dir: str = "extracted_images", workers: int = 4,
+                               thumbnail_size: Optional[Tuple[int, int]] = None) -> dict:
+        """
+        Save each unique embedded image once and map pages to images.
+        
+        Images are deduplicated by xref (so a logo repeated on every page is
+        only extracted once) and then by content hash (identical bytes under
+        different xrefs). Files are written from a thread pool. With
+        thumbnail_size, a downscaled JPEG is also written using Pillow's
+        draft-mode decoding, which lets JPEGs decode directly at reduced scale.
+        
+        Args:
+            output_dir: Directory to save images into
+            workers: Threads used for writing files and thumbnails
+            thumbnail_size: Optional (width, height) bounding box for thumbnails
+            
+        Returns:
+            {"images": {digest: {"path", "ext", "width", "height", "xref", "thumbnail"}},
+             "pages": {page_number: [digest, ...]}} with 1-based page numbers
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        doc = self.fitz_doc
+        images = {}
+        pages = {}
+        xref_digests = {}
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = []
+            
+            for page_num in range(len(doc)):
+                page_digests = []
+                for img in doc.load_page(page_num).get_images(full=True):
+                    xref = img[0]
+                    if xref not in xref_digests:
+                        base_image = doc.extract_image(xref)
+                        image_bytes = base_image["image"]
+                        digest = hashlib.sha256(image_bytes).hexdigest()
+                        xref_digests[xref] = digest
+                        
+                        if digest not in images:
+                            filename = f"img_{digest[:16]}.{base_image['ext']}"
+                            entry = {
+                                "path": os.path.join(output_dir, filename),
+                                "ext": base_image["ext"],
+                                "width": base_image.get("width"),
+                                "height": base_image.get("height"),
+                                "xref": xref,
+                                "thumbnail": None,
+                            }
+                            if thumbnail_size:
+                                entry["thumbnail"] = os.path.join(output_dir, "thumbnails",
+                                                                  f"img_{digest[:16]}.jpg")
+                            images[digest] = entry
+                            futures.append(pool.submit(_write_image, image_bytes, entry,
+                                                       thumbnail_size))
+                    
+                    digest = xref_digests[xref]
+                    if digest not in page_digests:
+                        page_digests.append(digest)
+                
+                if page_digests:
+                    pages[page_num + 1] = page_digests
+            
+            for future in futures:
+                future.result()  # surface write errors
+        
+        return {"images": images, "pages": pages}
+    
+    def extract_images(self, output_dir: str = "extracted_images") -> List[str]:
+        """
+        Save embedded images to output_dir (requires PyMuPDF).
+        
+        Returns:
+            List of saved image paths, one per unique image
+        """
+        manifest = self.extract_image_manifest(output_dir)
+        return [entry["path"] for entry in manifest["images"].values()]
+
+def _init_ocr_worker():
+    # One tesseract thread per process; parallelism comes from the pool
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+def _ocr_image(png_bytes: bytes, lang: str = "eng") -> Tuple[str, float]:
+    """
+    Process-pool task: OCR one rendered page. Returns (text, seconds).
+    """
+    import pytesseract
+    from PIL import Image
+    
+    start = time.perf_counter()
+    with Image.open(io.BytesIO(png_bytes)) as img:
+        text = pytesseract.image_to_string(img, lang=lang)
+    return text.strip(), time.perf_counter() - start
+
+def _write_image(image_bytes: bytes, entry: dict,
+                 thumbnail_size: Optional[Tuple[int, int]] = None):
+    """
+    Thread-pool task: write one image and, optionally, its thumbnail.
+    If the thumbnail cannot be made, entry["thumbnail"] is set to None.
+    """
+    with open(entry["path"], "wb") as f:
+        f.write(image_bytes)
+    
+    if thumbnail_size and entry["thumbnail"]:
+        try:
+            from PIL import Image
+            os.makedirs(os.path.dirname(entry["thumbnail"]), exist_ok=True)
+            with Image.open(io.BytesIO(image_bytes)) as img:
+                # draft() makes the JPEG decoder scale down while decoding
+                img.draft("RGB", thumbnail_size)
+                img = img.convert("RGB")
+                img.thumbnail(thumbnail_size, reducing_gap=2.0)
+                img.save(entry["thumbnail"], "JPEG", quality=85)
+        except Exception as e:
+            # e.g. JBIG2 or some JPX/CMYK images Pillow cannot decode
+            print(f"Could not create thumbnail for {entry['path']}: {e}")
+            entry["thumbnail"] = None
+
+def extract_text(pdf_path: PdfSource, method: str = "pdfplumber", workers: int = 1,
+                 chunk_size: int = 16, cache: Optional[ExtractionCache] = None,
+                 pages: Union[str, Iterable[int], None] = None,
+                 max_pages: Optional[int] = None, sample: Optional[int] = None) -> str:
     """
     Extract text from PDF using pdfplumber as primary method.
+    
+    Args:
+        pdf_path: Path to the PDF file, PDF bytes or a binary file object
+        method: "pdfplumber", "fitz" or "auto" (fitz per page, pdfplumber
+                for pages whose fitz text looks degenerate)
+        workers: Number of worker processes (1 = serial extraction)
+        chunk_size: Pages per worker task when extracting in parallel
+        cache: Optional ExtractionCache consulted per page before parsing
+        pages: Page spec such as "120-180" or iterable of 1-based page numbers
+        max_pages: Only extract the first max_pages selected pages
+        sample: Only extract this many evenly spaced selected pages
     """
+    selecting = pages is not None or max_pages is not None or sample is not None
     try:
+        if workers > 1:
+            return extract_text_parallel(pdf_path, method=method, workers=workers,
+                                         chunk_size=chunk_size, pages=pages,
+                                         max_pages=max_pages, sample=sample)
+        if cache is not None or method == "auto" or selecting:
+            with PdfDocument(pdf_path, cache=cache) as doc:
+                if selecting:
+                    doc.select_pages(pages, max_pages=max_pages, sample=sample)
+                return doc.extract_text(method)
         if method == "pdfplumber":
             return extract_text_pdfplumber(pdf_path)
         else:
@@ -23,14 +595,51 @@ def extract_text(pdf_path: str, method: str = "pdfplumber") -> str:
         print(f"Error extracting text: {e}")
         return ""
 
-def extract_text_pdfplumber(pdf_path: str) -> str:
+def iter_pages(pdf_path: PdfSource, method: str = "pdfplumber") -> Iterator[str]:
+    """
+    Yield the stripped text of each non-empty page, in order, as it is parsed.
+    
+    Unlike extract_text, the full document text is never joined in memory,
+    so downstream stages (see utils.iter_chunks) can start on the first pages
+    while later ones are still being read.
+    
+    Args:
+        pdf_path: Path to the PDF file, PDF bytes or a binary file object
+        method: "pdfplumber" or "fitz"
+    """
+    if method == "fitz":
+        try:
+            import fitz
+        except ImportError:
+            print("PyMuPDF (fitz) not available, using pdfplumber")
+            method = "pdfplumber"
+    
+    if method == "fitz":
+        doc = open_fitz(pdf_path)
+        try:
+            for page_num in range(len(doc)):
+                text = doc.load_page(page_num).get_text("text")
+                if text.strip():
+                    yield text.strip()
+        finally:
+            doc.close()
+    else:
+        with open_pdfplumber(pdf_path) as pdf:
+            for page in pdf.pages:
+                text = page.extract_text()
+                if text and text.strip():
+                    yield text.strip()
+                # Drop cached layout objects so memory stays bounded
+                page.flush_cache()
+
+def extract_text_pdfplumber(pdf_path: PdfSource) -> str:
     """
     Extract text using pdfplumber - more reliable for some PDFs.
     """
     text_parts = []
     
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        with open_pdfplumber(pdf_path) as pdf:
             for page in pdf.pages:
                 text = page.extract_text()
                 if text and text.strip():
@@ -40,14 +649,12 @@ def extract_text_pdfplumber(pdf_path: str) -> str:
     
     return "\n\n".join(text_parts)
 
-def extract_text_fitz(pdf_path: str) -> str:
+def extract_text_fitz(pdf_path: PdfSource) -> str:
     """
     Extract text using PyMuPDF (fitz).
     """
     try:
-        # CORRECT IMPORT
-        import fitz
-        doc = fitz.open(pdf_path)
+        doc = open_fitz(pdf_path)
         text_parts = []
         
         for page_num in range(len(doc)):
@@ -62,34 +669,129 @@ def extract_text_fitz(pdf_path: str) -> str:
         print(f"PyMuPDF (fitz) extraction error: {e}")
         return ""
 
-def get_pdf_info(pdf_path: str) -> dict:
+# Set in each worker process by _init_worker, so in-memory PDFs are sent once
+# per worker rather than once per task
+_worker_source = None
+
+def _init_worker(pdf_path: PdfSource):
+    global _worker_source
+    _worker_source = pdf_path
+
+def _extract_page_range(task: Tuple[str, Sequence[int]], pdf_path: PdfSource = None) -> List[str]:
+    """
+    Worker task: open the PDF and extract text for the given 0-based pages.
+    
+    Each worker opens the document itself so that no parser state has to
+    be pickled between processes. Returns one (possibly empty) string per page.
+    """
+    method, page_nums = task
+    if pdf_path is None:
+        pdf_path = _worker_source
+    texts = []
+    
+    if method == "fitz":
+        doc = open_fitz(pdf_path)
+        try:
+            for page_num in page_nums:
+                text = doc.load_page(page_num).get_text("text")
+                texts.append(text.strip())
+        finally:
+            doc.close()
+    elif method == "auto":
+        with PdfDocument(pdf_path) as doc:
+            texts = [doc.page_text(page_num, "auto") for page_num in page_nums]
+    else:
+        # pdfplumber page numbers are 1-based
+        with open_pdfplumber(pdf_path, pages=[p + 1 for p in page_nums]) as pdf:
+            for page in pdf.pages:
+                text = page.extract_text()
+                texts.append(text.strip() if text else "")
+    
+    return texts
+
+def _count_pages(pdf_path: PdfSource, method: str = "pdfplumber") -> int:
+    """
+    Count pages with the same engine that will do the extraction.
+    """
+    if method in ("fitz", "auto"):
+        doc = open_fitz(pdf_path)
+        try:
+            return len(doc)
+        finally:
+            doc.close()
+    with open_pdfplumber(pdf_path) as pdf:
+        return len(pdf.pages)
+
+def extract_text_parallel(pdf_path: PdfSource, method: str = "pdfplumber",
+                          workers: Optional[int] = None, chunk_size: int = 16,
+                          pages: Union[str, Iterable[int], None] = None,
+                          max_pages: Optional[int] = None,
+                          sample: Optional[int] = None) -> str:
+    """
+    Extract text by sharding page ranges across a process pool.
+    
+    Args:
+        pdf_path: Path to the PDF file, PDF bytes or a binary file object
+        method: "pdfplumber", "fitz" or "auto"
+        workers: Number of worker processes (default: CPU count)
+        chunk_size: Number of consecutive pages handled by one worker task
+        pages, max_pages, sample: Page selection, as in extract_text
+        
+    Returns:
+        Extracted text in page order, same format as the serial extractors
+    """
+    if method in ("fitz", "auto"):
+        try:
+            import fitz
+        except ImportError:
+            print("PyMuPDF (fitz) not available, using pdfplumber")
+            method = "pdfplumber"
+    
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, chunk_size)
+    
+    try:
+        if not isinstance(pdf_path, (str, os.PathLike)):
+            # File objects can't be pickled; ship the bytes to workers instead
+            pdf_path = pdf_buffer(pdf_path)
+        
+        page_nums = select_pages(_count_pages(pdf_path, method), pages,
+                                 max_pages=max_pages, sample=sample)
+        tasks = [(method, page_nums[i:i + chunk_size])
+                 for i in range(0, len(page_nums), chunk_size)]
+        
+        if workers == 1 or len(tasks) <= 1:
+            results = [_extract_page_range(task, pdf_path) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                                     initializer=_init_worker,
+                                     initargs=(pdf_path,)) as pool:
+                # map() yields results in task order, so pages stay ordered
+                results = list(pool.map(_extract_page_range, tasks))
+    except Exception as e:
+        print(f"Parallel extraction error: {e}")
+        return ""
+    
+    text_parts = [text for page_texts in results for text in page_texts if text]
+    return "\n\n".join(text_parts)
+
+def get_pdf_info(pdf_path: PdfSource, cache: Optional[ExtractionCache] = None) -> dict:
     """
     Get basic information about PDF.
     """
     info = {"pages": 0, "title": "", "author": "", "subject": ""}
     
     try:
-        # Try pdfplumber first (more reliable)
-        with pdfplumber.open(pdf_path) as pdf:
-            info["pages"] = len(pdf.pages)
-            
-        # Try to get metadata from PyMuPDF if available
-        try:
-            import fitz
-            doc = fitz.open(pdf_path)
-            metadata = doc.metadata
-            info["title"] = metadata.get("title", "")
-            info["author"] = metadata.get("author", "")
-            info["subject"] = metadata.get("subject", "")
-            doc.close()
-        except:
-            pass
-            
+        with PdfDocument(pdf_path, cache=cache) as doc:
+            info.update(doc.info)
     except Exception as e:
         print(f"Error getting PDF info: {e}")
         # Fallback: try to count pages using file size estimation
         try:
-            file_size = os.path.getsize(pdf_path)
+            if isinstance(pdf_path, (str, os.PathLike)):
+                file_size = os.path.getsize(pdf_path)
+            else:
+                file_size = len(pdf_buffer(pdf_path))
             # Rough estimate: 1 page per 5KB
             info["pages"] = max(1, file_size // 5000)
         except:
@@ -97,7 +799,7 @@ def get_pdf_info(pdf_path: str) -> dict:
     
     return info
 
-def extract_images(pdf_path: str, output_dir: str = "extracted_images") -> List[str]:
+def extract_images(pdf_path: PdfSource, output_dir: str = "extracted_images") -> List[str]:
     """
     Extract images from PDF (optional functionality).
     """
@@ -105,28 +807,28 @@ def extract_images(pdf_path: str, output_dir: str = "extracted_images") -> List[
     saved_images = []
     
     try:
-        import fitz  # CORRECT IMPORT
-        doc = fitz.open(pdf_path)
-        
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            image_list = page.get_images(full=True)
-            
-            for img_index, img in enumerate(image_list, start=1):
-                xref = img[0]
-                base_image = doc.extract_image(xref)
-                image_bytes = base_image["image"]
-                image_ext = base_image["ext"]
-                
-                filename = f"page_{page_num+1}_img_{img_index}.{image_ext}"
-                filepath = os.path.join(output_dir, filename)
-                
-                with open(filepath, "wb") as f:
-                    f.write(image_bytes)
-                saved_images.append(filepath)
-        
-        doc.close()
+        with PdfDocument(pdf_path) as doc:
+            saved_images = doc.extract_images(output_dir)
+    except Exception as e:
+        print(f"Image extraction not available: {e}")
+    
+    return saved_images
+
+def extract_image_manifest(pdf_path: PdfSource, output_dir: str = "extracted_images",
+                           workers: int = 4,
+                           thumbnail_size: Optional[Tuple[int, int]] = None) -> dict:
+    """
+    Extract unique images and return a page -> image manifest
+    (see PdfDocument.extract_image_manifest).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = {"images": {}, "pages": {}}
+    
+    try:
+        with PdfDocument(pdf_path) as doc:
+            manifest = doc.extract_image_manifest(output_dir, workers=workers,
+                                                  thumbnail_size=thumbnail_size)
     except Exception as e:
         print(f"Image extraction not available: {e}")
     
-    return saved_images
\ No newline at end of file
+    return manifest
\ No newline at end of file
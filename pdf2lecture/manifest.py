@@ -0,0 +1,113 @@
+# pdf2lecture/manifest.py
+import hashlib
+import json
+import os
+from typing import List, Optional
+
+def text_hash(text: str) -> str:
+    """
+    SHA-256 of a text, used to key pages, chunks and slides in the manifest.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+class RunManifest:
+    """
+    Record of what a pipeline run produced, saved as manifest.json in the
+    output directory.
+
+    On the next run against the same output directory, pages whose content
+    hash is unchanged reuse their extracted text, chunks whose text hash is
+    unchanged reuse their summary, and slides whose summary is unchanged
+    reuse their image and narration files. Only the parts of a revised PDF
+    that actually changed are reprocessed.
+    """
+
+    FILENAME = "manifest.json"
+    VERSION = 1
+
+    def __init__(self, output_dir: str, previous: Optional[dict] = None):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, self.FILENAME)
+        self.previous = previous or {}
+        self.current = {"version": self.VERSION, "pages": {}, "chunks": [], "slides": []}
+
+        self._previous_summaries = {}
+        for chunk in self.previous.get("chunks", []):
+            self._previous_summaries[(chunk["hash"], chunk["model"])] = chunk["summary"]
+
+    @classmethod
+    def load(cls, output_dir: str) -> "RunManifest":
+        """
+        Load the previous run's manifest (if any and if compatible).
+        """
+        path = os.path.join(output_dir, cls.FILENAME)
+        previous = None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+            if previous.get("version") != cls.VERSION:
+                previous = None
+        except (OSError, ValueError):
+            previous = None
+        return cls(output_dir, previous)
+
+    def save(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.current, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+    # Pages
+
+    def previous_page(self, page_num: int, page_hash: Optional[str]) -> Optional[dict]:
+        """Previous {"hash", "text", "engine"} for a page if its hash is unchanged."""
+        if page_hash is None:
+            return None
+        entry = self.previous.get("pages", {}).get(str(page_num))
+        if entry and entry["hash"] == page_hash:
+            return entry
+        return None
+
+    def record_page(self, page_num: int, page_hash: Optional[str], text: str, engine: str):
+        if page_hash is not None:
+            self.current["pages"][str(page_num)] = {"hash": page_hash, "text": text,
+                                                    "engine": engine}
+
+    # Chunks and summaries
+
+    def previous_summary(self, chunk: str, model: str) -> Optional[str]:
+        """Summary of an identical chunk from the previous run with the same model."""
+        return self._previous_summaries.get((text_hash(chunk), model))
+
+    def record_chunk(self, chunk: str, summary: str, model: str):
+        self.current["chunks"].append({"hash": text_hash(chunk), "summary": summary,
+                                       "model": model})
+
+    def previous_overall_summary(self, chunks: List[str], model: str) -> Optional[str]:
+        """Overall summary, reused only if every chunk is unchanged."""
+        previous = self.previous.get("overall")
+        if previous and previous["model"] == model and \
+                previous["chunks"] == [text_hash(c) for c in chunks]:
+            return previous["summary"]
+        return None
+
+    def record_overall_summary(self, chunks: List[str], summary: str, model: str):
+        self.current["overall"] = {"chunks": [text_hash(c) for c in chunks],
+                                   "summary": summary, "model": model}
+
+    # Slides
+
+    def previous_slide(self, index: int, summary: str) -> dict:
+        """Previous artifacts for slide `index` if its summary is unchanged."""
+        slides = self.previous.get("slides", [])
+        if index < len(slides) and slides[index]["hash"] == text_hash(summary):
+            return slides[index]
+        return {}
+
+    def record_slide(self, index: int, summary: str, **artifacts):
+        slides = self.current["slides"]
+        while len(slides) <= index:
+            slides.append({})
+        slides[index].update(artifacts)
+        slides[index]["hash"] = text_hash(summary)
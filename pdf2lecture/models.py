@@ -0,0 +1,247 @@
+# pdf2lecture/models.py
+import importlib.util
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+BACKENDS = ("pytorch", "int8", "onnx")
+
+class LoadedModel:
+    """
+    A summarization pipeline and its tokenizer, plus load statistics.
+    """
+
+    def __init__(self, name: str, device: int, backend: str, pipeline, tokenizer,
+                 load_seconds: float):
+        self.name = name
+        self.device = device
+        self.backend = backend
+        self.pipeline = pipeline
+        self.tokenizer = tokenizer
+        self.load_seconds = load_seconds
+        self.bytes = model_bytes(pipeline.model)
+        self.uses = 0
+        self.last_used = time.monotonic()
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "device": self.device,
+            "backend": self.backend,
+            "load_seconds": self.load_seconds,
+            "bytes": self.bytes,
+            "uses": self.uses,
+            "idle_seconds": time.monotonic() - self.last_used,
+        }
+
+def model_bytes(model) -> int:
+    """
+    Size of a model's weights in bytes.
+    
+    For torch models this walks the state dict, which also covers the packed
+    weights of dynamically quantized layers; tied weights are counted once.
+    For ONNX Runtime models it is the size of the exported graph files.
+    """
+    if hasattr(model, "state_dict"):
+        total = 0
+        seen = set()
+        for value in model.state_dict().values():
+            for tensor in value if isinstance(value, (tuple, list)) else (value,):
+                if not hasattr(tensor, "element_size"):
+                    continue
+                try:
+                    pointer = tensor.data_ptr()
+                except RuntimeError:
+                    pointer = id(tensor)
+                if pointer in seen:
+                    continue
+                seen.add(pointer)
+                total += tensor.numel() * tensor.element_size()
+        return total
+    
+    model_dir = getattr(model, "model_save_dir", None)
+    if model_dir and os.path.isdir(model_dir):
+        return sum(os.path.getsize(os.path.join(model_dir, name))
+                   for name in os.listdir(model_dir) if name.endswith((".onnx", ".onnx_data")))
+    return 0
+
+def onnx_export_dir(model_name: str) -> str:
+    """
+    Where the ONNX export of a model is kept, so it is only exported once.
+    """
+    from .cache import default_cache_dir
+    return os.path.join(default_cache_dir(), "onnx", model_name.replace("/", "--"))
+
+def load_torch_model(model_name: str):
+    """
+    Load a seq2seq model, preferring safetensors weights.
+    
+    safetensors files are memory-mapped rather than unpickled, so loading is
+    faster and several worker processes loading the same model read it
+    through one shared copy in the page cache.
+    """
+    from transformers import AutoModelForSeq2SeqLM
+    try:
+        return AutoModelForSeq2SeqLM.from_pretrained(model_name, use_safetensors=True)
+    except OSError:
+        return AutoModelForSeq2SeqLM.from_pretrained(model_name)  # only .bin weights
+
+def check_backend(backend: str):
+    """
+    Raise RuntimeError with an install hint if a backend's extra packages
+    are missing. This is deliberately not ImportError, which callers take to
+    mean transformers itself is unavailable and fall back to extractive
+    summaries.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; choose from {', '.join(BACKENDS)}")
+    if backend == "onnx":
+        for module in ("optimum", "onnxruntime"):
+            if importlib.util.find_spec(module) is None:
+                raise RuntimeError(f"The onnx backend needs optimum and onnxruntime "
+                                   f"(missing {module}); install them with "
+                                   f"pip install 'optimum[onnxruntime]' or use --backend pytorch")
+
+def _default_max_bytes() -> Optional[int]:
+    megabytes = os.environ.get("PDF2LECTURE_MODEL_MEMORY_MB")
+    return int(megabytes) * 1024 * 1024 if megabytes else None
+
+class ModelRegistry:
+    """
+    Process-wide store of loaded summarization models.
+
+    Each (model name, device, backend) is loaded once, with the tokenizer
+    loaded a single time and handed to the pipeline, and the same instance
+    is returned to every caller. When the resident size of all models exceeds
+    max_bytes, the least recently used other models are dropped from the
+    registry; their memory is freed once no Summarizer still references them.
+
+    Backends:
+        pytorch: the model as published (fp32 on CPU)
+        int8: PyTorch dynamic int8 quantization of the Linear layers (CPU)
+        onnx: ONNX Runtime encoder-decoder via optimum, exported on first
+              use and kept under the cache directory
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Args:
+            max_bytes: Memory cap for loaded models (default: the
+                       PDF2LECTURE_MODEL_MEMORY_MB environment variable,
+                       or no cap)
+        """
+        self.max_bytes = max_bytes if max_bytes is not None else _default_max_bytes()
+        self._models: Dict[Tuple[str, int, str], LoadedModel] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model_name: str, device: int = -1, backend: str = "pytorch") -> LoadedModel:
+        """
+        Return the shared instance of a model, loading it on first use.
+
+        Args:
+            model_name: HuggingFace model name
+            device: -1 for CPU, 0+ for GPU
+            backend: "pytorch", "int8" or "onnx"
+
+        Returns:
+            LoadedModel with .pipeline and .tokenizer
+        """
+        check_backend(backend)
+        if backend != "pytorch" and device >= 0:
+            print(f"Backend {backend} is CPU-only; running on CPU")
+            device = -1
+        
+        key = (model_name, device, backend)
+        with self._lock:
+            loaded = self._models.get(key)
+            if loaded is None:
+                loaded = self._load(model_name, device, backend)
+                self._models[key] = loaded
+                self._enforce_limit(keep=key)
+            loaded.uses += 1
+            loaded.last_used = time.monotonic()
+            return loaded
+
+    def _load(self, model_name: str, device: int, backend: str) -> LoadedModel:
+        from transformers import pipeline, AutoTokenizer
+
+        print(f"Loading model {model_name} ({backend})...")
+        start = time.perf_counter()
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        
+        if backend == "int8":
+            import torch
+            model = load_torch_model(model_name)
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        elif backend == "onnx":
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+            export_dir = onnx_export_dir(model_name)
+            if os.path.isdir(export_dir):
+                model = ORTModelForSeq2SeqLM.from_pretrained(export_dir)
+            else:
+                print("   Exporting to ONNX (first use only)...")
+                model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+                model.save_pretrained(export_dir)
+        else:
+            model = load_torch_model(model_name)
+        
+        summarization = pipeline(
+            "summarization",
+            model=model,
+            tokenizer=tokenizer,
+            device=device
+        )
+        loaded = LoadedModel(model_name, device, backend, summarization, tokenizer,
+                             time.perf_counter() - start)
+        print(f"   Loaded in {loaded.load_seconds:.1f}s ({loaded.bytes / 1024 / 1024:.0f} MB)")
+        return loaded
+
+    def _enforce_limit(self, keep: Tuple[str, int, str]):
+        if self.max_bytes is None:
+            return
+        by_age = sorted(self._models.items(), key=lambda item: item[1].last_used)
+        total = sum(loaded.bytes for loaded in self._models.values())
+        for key, loaded in by_age:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            print(f"Evicting model {loaded.name} ({loaded.bytes / 1024 / 1024:.0f} MB)")
+            del self._models[key]
+            total -= loaded.bytes
+
+    def evict_idle(self, max_idle_seconds: float) -> int:
+        """
+        Drop models not used for max_idle_seconds. Returns how many were dropped.
+        """
+        now = time.monotonic()
+        with self._lock:
+            idle = [key for key, loaded in self._models.items()
+                    if now - loaded.last_used > max_idle_seconds]
+            for key in idle:
+                del self._models[key]
+        return len(idle)
+
+    def clear(self):
+        """Drop every loaded model."""
+        with self._lock:
+            self._models.clear()
+
+    def stats(self) -> List[dict]:
+        """Load time, resident size and usage of each loaded model."""
+        with self._lock:
+            return [loaded.stats() for loaded in self._models.values()]
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_registry() -> ModelRegistry:
+    """
+    The process-wide ModelRegistry, created on first use.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
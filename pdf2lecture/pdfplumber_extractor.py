@@ -1,16 +1,30 @@
 # pdf2lecture/pdfplumber_extractor.py
+import io
 import os
-from typing import List
+from typing import BinaryIO, List, Union
 import pdfplumber
 
-def extract_text(pdf_path: str) -> str:
+# A filesystem path, the raw PDF bytes, or a binary file object (e.g. an upload)
+PdfSource = Union[str, bytes, bytearray, memoryview, BinaryIO]
+
+def open_pdf(pdf_path: PdfSource, **kwargs):
+    """
+    Open a path, bytes-like object or binary file object with pdfplumber.
+    """
+    if isinstance(pdf_path, (bytes, bytearray, memoryview)):
+        pdf_path = io.BytesIO(pdf_path)
+    elif hasattr(pdf_path, "seek"):
+        pdf_path.seek(0)
+    return pdfplumber.open(pdf_path, **kwargs)
+
+def extract_text(pdf_path: PdfSource) -> str:
     """
     Extract text from PDF using only pdfplumber.
     """
     text_parts = []
     
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        with open_pdf(pdf_path) as pdf:
             for page in pdf.pages:
                 # Try multiple extraction methods
                 text = page.extract_text()
@@ -29,21 +43,21 @@ def extract_text(pdf_path: str) -> str:
     
     return "\n\n".join(text_parts)
 
-def get_pdf_info(pdf_path: str) -> dict:
+def get_pdf_info(pdf_path: PdfSource) -> dict:
     """
     Get basic PDF information using pdfplumber.
     """
     info = {"pages": 0, "title": "", "author": "", "subject": ""}
     
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        with open_pdf(pdf_path) as pdf:
             info["pages"] = len(pdf.pages)
     except Exception as e:
         print(f"Error getting PDF info: {e}")
     
     return info
 
-def extract_images(pdf_path: str, output_dir: str = "extracted_images") -> List[str]:
+def extract_images(pdf_path: PdfSource, output_dir: str = "extracted_images") -> List[str]:
     """
     Basic image extraction (pdfplumber has limited image support).
     """
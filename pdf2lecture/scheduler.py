@@ -0,0 +1,256 @@
+# pdf2lecture/scheduler.py
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .cache import SummaryCache
+
+EXTRACTIVE = "extractive"
+
+# Model tiers from best to cheapest, with CPU cost priors used until real
+# timings are measured: seconds to load, fixed seconds per call, and
+# seconds per input token.
+DEFAULT_TIERS = [
+    {"model": "facebook/bart-large-cnn", "load": 8.0, "fixed": 1.5, "per_token": 0.012},
+    {"model": "sshleifer/distilbart-cnn-12-6", "load": 5.0, "fixed": 0.8, "per_token": 0.006},
+    {"model": EXTRACTIVE, "load": 0.0, "fixed": 0.0, "per_token": 0.00002},
+]
+
+def estimate_tokens(text: str) -> int:
+    """Rough BPE token count for a text, without loading a tokenizer."""
+    return int(len(text.split()) * 1.3) + 1
+
+class BudgetedSummarizer:
+    """
+    Deadline-aware summarizer that picks a model tier per chunk.
+
+    Given a wall-clock budget, each chunk's cost on each tier is predicted
+    from its token count (plus the tier's load time if it is not loaded
+    yet). The plan starts with every chunk on the extractive fallback, then
+    upgrades chunks, cheapest first, to distilbart and then to
+    bart-large-cnn while the predicted total stays within the budget. After
+    every chunk the measured time corrects that tier's cost estimate and the
+    remaining chunks are re-planned against the time actually left.
+    Predicted and actual times are printed per chunk and kept in self.log.
+
+    Same summarize_chunk_list / iter_chunk_summaries / overall_summary
+    interface as Summarizer.
+    """
+
+    def __init__(self, time_budget: float, tiers: Optional[List[dict]] = None,
+                 cache: Optional[SummaryCache] = None, backend: str = "pytorch",
+                 safety: float = 0.9):
+        """
+        Args:
+            time_budget: Seconds available for summarization, counted from now
+            tiers: Model tiers best-first (default: DEFAULT_TIERS); the last
+                   should be EXTRACTIVE so there is always a fallback
+            cache: Optional summary cache for the model tiers
+            backend: Inference backend for the model tiers (see Summarizer)
+            safety: Fraction of the remaining budget the plan may use
+        """
+        self.deadline = time.perf_counter() + time_budget
+        self.time_budget = time_budget
+        self.tiers = [dict(tier) for tier in (tiers or DEFAULT_TIERS)]
+        self.cache = cache
+        self.backend = backend
+        self.safety = safety
+        self.model_name = "budgeted"
+        self.log: List[dict] = []
+        self._summarizers: Dict[str, object] = {}
+        self._correction = {tier["model"]: 1.0 for tier in self.tiers}
+
+    def _remaining(self) -> float:
+        return self.deadline - time.perf_counter()
+
+    def _cost(self, tier: dict, tokens: int) -> float:
+        """Predicted seconds for one chunk on a tier, excluding loading."""
+        return (tier["fixed"] + tier["per_token"] * tokens) * self._correction[tier["model"]]
+
+    def _load_cost(self, tier: dict) -> float:
+        return 0.0 if tier["model"] in self._summarizers else tier["load"]
+
+    def plan(self, token_counts: List[int], budget: float) -> List[int]:
+        """
+        Assign a tier index to each chunk so the predicted total fits budget.
+
+        Args:
+            token_counts: Input tokens per chunk
+            budget: Seconds available
+
+        Returns:
+            Tier index (into self.tiers) per chunk
+        """
+        cheapest = len(self.tiers) - 1
+        assignment = [cheapest] * len(token_counts)
+        total = self._load_cost(self.tiers[cheapest]) + sum(
+            self._cost(self.tiers[cheapest], tokens) for tokens in token_counts)
+
+        # Upgrade tier by tier, from the next-cheapest up to the best
+        for t in range(cheapest - 1, -1, -1):
+            tier = self.tiers[t]
+            upgrades = sorted(
+                (self._cost(tier, tokens) - self._cost(self.tiers[assignment[i]], tokens), i)
+                for i, tokens in enumerate(token_counts))
+            load = self._load_cost(tier)
+            for delta, i in upgrades:
+                if total + delta + load > budget:
+                    break
+                assignment[i] = t
+                total += delta + load
+                load = 0.0  # paid once, with the first chunk on this tier
+        return assignment
+
+    def _summarizer(self, model: str):
+        summarizer = self._summarizers.get(model)
+        if summarizer is None:
+            if model == EXTRACTIVE:
+                from .summarizer import ExtractiveSummarizer
+                summarizer = ExtractiveSummarizer()
+            else:
+                from .summarizer import Summarizer
+                summarizer = Summarizer(model_name=model, cache=self.cache, backend=self.backend)
+            self._summarizers[model] = summarizer
+        return summarizer
+
+    def _run(self, t: int, text: str, tokens: int, **kwargs) -> str:
+        """Summarize on tier t, then correct the tier's estimate from the timing."""
+        tier = self.tiers[t]
+        loading = tier["model"] not in self._summarizers
+        start = time.perf_counter()
+        summarizer = self._summarizer(tier["model"])
+        calls = getattr(summarizer, "generate_calls", None)
+        loaded = time.perf_counter()
+        summary = summarizer.summarize_chunk(text, **kwargs)
+        end = time.perf_counter()
+
+        predicted = self._cost(tier, tokens)
+        actual = end - loaded
+        # Cache hits and short-text shortcuts return in ~1 ms and say nothing
+        # about the model's speed, so only real model calls correct the estimate
+        generated = calls is None or summarizer.generate_calls > calls
+        if predicted > 0 and generated:
+            # Exponential moving average of actual / prior cost, clamped so
+            # one outlier cannot swing the plan
+            ratio = actual / (predicted / self._correction[tier["model"]])
+            ratio = min(max(ratio, 0.25), 4.0)
+            self._correction[tier["model"]] = 0.5 * self._correction[tier["model"]] + 0.5 * ratio
+        self.log.append({"model": tier["model"], "tokens": tokens, "predicted": predicted,
+                         "actual": actual, "load": loaded - start if loading else 0.0,
+                         "generated": generated})
+        return summary
+
+    def chunk_by_tokens(self, text: str, max_tokens: Optional[int] = None):
+        """See Summarizer.chunk_by_tokens; uses the best tier's tokenizer."""
+        return self._summarizer(self.tiers[0]["model"]).chunk_by_tokens(text, max_tokens)
+
+    def summarize_chunk(self, text: str, max_length: int = 150, min_length: int = 30) -> str:
+        """
+        Summarize one chunk on the best tier that fits the remaining budget.
+        Lengths apply to the model tiers; the extractive tier ignores them.
+        """
+        tokens = estimate_tokens(text)
+        t = self.plan([tokens], self._remaining() * self.safety)[0]
+        if self.tiers[t]["model"] == EXTRACTIVE:
+            return self._summarizer(EXTRACTIVE).summarize_chunk(text)
+        return self._run(t, text, tokens, max_length=max_length, min_length=min_length)
+
+    def summarize_chunk_list(self, chunks: List[str],
+                             token_ids: Optional[List[List[int]]] = None,
+                             batch_size: int = 1) -> List[str]:
+        """
+        Summarize chunks within the remaining time budget.
+
+        Args:
+            chunks: Text chunks
+            token_ids: Optional token ids per chunk, used for exact token counts
+            batch_size: Ignored; chunks run one at a time so every timing
+                        can correct the plan
+
+        Returns:
+            List of summaries in chunk order
+        """
+        summaries = [None] * len(chunks)
+        for i, summary in self.iter_chunk_summaries(chunks, token_ids, batch_size):
+            summaries[i] = summary
+        return summaries
+
+    def iter_chunk_summaries(self, chunks: List[str],
+                             token_ids: Optional[List[List[int]]] = None,
+                             batch_size: int = 1) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (chunk index, summary) as each model-tier chunk finishes;
+        chunks left on the extractive tier arrive together at the end.
+        """
+        if token_ids is not None:
+            token_counts = [len(ids) for ids in token_ids]
+        else:
+            token_counts = [estimate_tokens(chunk) for chunk in chunks]
+
+        rest = []
+        extractive = len(self.tiers) - 1
+        assignment = self.plan(token_counts, self._remaining() * self.safety)
+        print(f"Budget {self._remaining():.0f}s for {len(chunks)} chunks: " + ", ".join(
+            f"{assignment.count(t)} x {tier['model']}" for t, tier in enumerate(self.tiers)
+            if assignment.count(t)))
+
+        for i, chunk in enumerate(chunks):
+            # Re-plan what is left with corrected estimates and the real clock
+            assignment[i:] = self.plan(token_counts[i:], self._remaining() * self.safety)
+            t = assignment[i]
+            if t == extractive:
+                rest.append(i)  # done together at the end in one vectorized pass
+                continue
+            summary = self._run(t, chunk, token_counts[i])
+            entry = self.log[-1]
+            print(f"  Chunk {i + 1}/{len(chunks)}: {entry['model']} "
+                  f"(predicted {entry['predicted']:.1f}s, actual {entry['actual']:.1f}s"
+                  + (f", load {entry['load']:.1f}s" if entry['load'] else "")
+                  + ("" if entry['generated'] else ", cached") + ")")
+            yield i, summary
+
+        if rest:
+            start = time.perf_counter()
+            extracted = self._summarizer(EXTRACTIVE).summarize_chunk_list([chunks[i] for i in rest])
+            actual = time.perf_counter() - start
+            predicted = sum(self._cost(self.tiers[extractive], token_counts[i]) for i in rest)
+            self.log.append({"model": EXTRACTIVE, "tokens": sum(token_counts[i] for i in rest),
+                             "predicted": predicted, "actual": actual, "load": 0.0,
+                             "generated": True})
+            print(f"  {len(rest)} chunks extractive (predicted {predicted:.1f}s, actual {actual:.1f}s)")
+            yield from zip(rest, extracted)
+
+        self.print_report()
+
+    def overall_summary(self, slide_summaries: List[str], batch_size: int = 1) -> str:
+        """
+        Overall summary on the best tier that still fits the remaining budget
+        (one call, so batch_size is accepted for interface compatibility and
+        ignored).
+        """
+        combined = " ".join(slide_summaries)
+        if len(combined) <= 500:
+            return combined[:300] + "..." if len(combined) > 300 else combined
+
+        tokens = min(estimate_tokens(combined), 1024)  # inputs are truncated
+        budget = self._remaining() * self.safety
+        for t, tier in enumerate(self.tiers):
+            if t == len(self.tiers) - 1 or self._cost(tier, tokens) + self._load_cost(tier) <= budget:
+                if tier["model"] == EXTRACTIVE:
+                    return self._summarizer(EXTRACTIVE).overall_summary(slide_summaries)
+                summary = self._run(t, combined, tokens, max_length=200, min_length=50)
+                print(f"  Overall summary: {tier['model']} (predicted {self.log[-1]['predicted']:.1f}s, "
+                      f"actual {self.log[-1]['actual']:.1f}s)")
+                return summary
+
+    def print_report(self):
+        """Predicted vs. actual time per tier, against the budget."""
+        used = self.time_budget - self._remaining()
+        print(f"  Time budget: {self.time_budget:.0f}s, used {used:.1f}s")
+        for tier in self.tiers:
+            entries = [entry for entry in self.log if entry["model"] == tier["model"]]
+            if entries:
+                predicted = sum(entry["predicted"] for entry in entries)
+                actual = sum(entry["actual"] for entry in entries)
+                load = sum(entry["load"] for entry in entries)
+                print(f"    {tier['model']}: {len(entries)} calls, predicted {predicted:.1f}s, "
+                      f"actual {actual:.1f}s (+{load:.1f}s loading)")
@@ -7,6 +7,8 @@ import os
 import textwrap
 from typing import List
 
+from .utils import split_sentences
+
 def create_pptx(slide_texts: List[str], output_path: str = "lecture.pptx", 
                 title: str = "Generated Lecture") -> str:
     """
@@ -44,18 +46,18 @@ def create_pptx(slide_texts: List[str], output_path: str = "lecture.pptx",
         text_frame.word_wrap = True
         
         # Split content into bullet points
-        paragraphs = [p.strip() for p in content.split('. ') if p.strip()]
+        paragraphs = split_sentences(content)
         
         for j, paragraph in enumerate(paragraphs[:6]):  # Max 6 bullets
             if j == 0:
                 p = text_frame.paragraphs[0]
                 p.text = paragraph
-                if not paragraph.endswith('.'):
+                if not paragraph.endswith(('.', '!', '?')):
                     p.text += '.'
             else:
                 p = text_frame.add_paragraph()
                 p.text = paragraph
-                if not paragraph.endswith('.'):
+                if not paragraph.endswith(('.', '!', '?')):
                     p.text += '.'
                 p.level = 1
             
@@ -80,8 +82,19 @@ def create_slide_images(slide_texts: List[str], output_dir: str = "slide_images"
     """
     os.makedirs(output_dir, exist_ok=True)
     image_paths = []
+    font = load_slide_font()
+    
+    for i, text in enumerate(slide_texts, 1):
+        filename = os.path.join(output_dir, f"slide_{i:02d}.png")
+        render_slide_image(text, i, filename, size=size, font=font)
+        image_paths.append(filename)
     
-    # Try to load a nice font
+    return image_paths
+
+def load_slide_font(font_size: int = 28):
+    """
+    Load a TrueType font for slide images, falling back to PIL's default.
+    """
     try:
         # Try different possible font paths
         font_paths = [
@@ -92,50 +105,65 @@ def create_slide_images(slide_texts: List[str], output_dir: str = "slide_images"
         font = None
         for path in font_paths:
             if os.path.exists(path):
-                font = ImageFont.truetype(path, 28)
+                font = ImageFont.truetype(path, font_size)
                 break
         if font is None:
             font = ImageFont.load_default()
     except:
         font = ImageFont.load_default()
+    return font
+
+def render_slide_image(text: str, index: int, output_path: str,
+                       size: tuple = (1280, 720), font=None) -> str:
+    """
+    Render a single slide image.
     
-    for i, text in enumerate(slide_texts, 1):
-        # Create image
-        img = Image.new('RGB', size, color=(255, 255, 255))
-        draw = ImageDraw.Draw(img)
-        
-        # Draw slide number
-        title = f"Slide {i}"
-        title_bbox = draw.textbbox((0, 0), title, font=font)
-        title_width = title_bbox[2] - title_bbox[0]
-        draw.text(((size[0] - title_width) // 2, 30), title, font=font, fill=(0, 0, 0))
-        
-        # Draw content (wrapped text)
-        margin = 50
-        y_position = 100
-        max_width = size[0] - 2 * margin
-        
-        # Wrap text
-        wrapped_text = textwrap.fill(text, width=50)
-        lines = wrapped_text.split('\n')
+    Args:
+        text: Slide content
+        index: 1-based slide number shown as the title
+        output_path: PNG file to write
+        size: Image dimensions (width, height)
+        font: Font from load_slide_font() (loaded if not given)
         
-        for line in lines:
-            line_bbox = draw.textbbox((0, 0), line, font=font)
-            line_height = line_bbox[3] - line_bbox[1] + 5
-            draw.text((margin, y_position), line, font=font, fill=(0, 0, 0))
-            y_position += line_height
-            
-            # Stop if running out of space
-            if y_position > size[1] - 50:
-                draw.text((margin, y_position), "...", font=font, fill=(0, 0, 0))
-                break
+    Returns:
+        Path to the created image
+    """
+    if font is None:
+        font = load_slide_font()
+    
+    # Create image
+    img = Image.new('RGB', size, color=(255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    
+    # Draw slide number
+    title = f"Slide {index}"
+    title_bbox = draw.textbbox((0, 0), title, font=font)
+    title_width = title_bbox[2] - title_bbox[0]
+    draw.text(((size[0] - title_width) // 2, 30), title, font=font, fill=(0, 0, 0))
+    
+    # Draw content (wrapped text)
+    margin = 50
+    y_position = 100
+    max_width = size[0] - 2 * margin
+    
+    # Wrap text
+    wrapped_text = textwrap.fill(text, width=50)
+    lines = wrapped_text.split('\n')
+    
+    for line in lines:
+        line_bbox = draw.textbbox((0, 0), line, font=font)
+        line_height = line_bbox[3] - line_bbox[1] + 5
+        draw.text((margin, y_position), line, font=font, fill=(0, 0, 0))
+        y_position += line_height
         
-        # Save image
-        filename = os.path.join(output_dir, f"slide_{i:02d}.png")
-        img.save(filename)
-        image_paths.append(filename)
+        # Stop if running out of space
+        if y_position > size[1] - 50:
+            draw.text((margin, y_position), "...", font=font, fill=(0, 0, 0))
+            break
     
-    return image_paths
+    # Save image
+    img.save(output_path)
+    return output_path
 
 def add_speaker_notes(pptx_path: str, notes: List[str]) -> str:
     """
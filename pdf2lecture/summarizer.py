@@ -1,23 +1,50 @@
-from transformers import pipeline, AutoTokenizer
-from typing import List, Tuple
-import torch
-from .utils import chunk_text
+import importlib.util
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator, List, Optional, Tuple
+from .cache import SummaryCache
+from .models import ModelRegistry, check_backend, get_registry
+from .utils import chunk_text, clean_whitespace, iter_chunks, sentence_spans
 
 class Summarizer:
     """
     Text summarization using Transformer models.
     """
     
-    def __init__(self, model_name: str = "facebook/bart-large-cnn", device: int = -1):
+    def __init__(self, model_name: str = "facebook/bart-large-cnn", device: int = -1,
+                 cache: Optional[SummaryCache] = None, registry: Optional[ModelRegistry] = None,
+                 backend: str = "pytorch", assistant_model: Optional[str] = None):
         """
         Initialize summarizer with specified model.
         
+        Models come from a process-wide registry, so constructing another
+        Summarizer for an already loaded model is instant.
+        
         Args:
             model_name: HuggingFace model name
             device: -1 for CPU, 0+ for GPU
+            cache: Optional on-disk cache of chunk summaries, reused across
+                   runs for the same model revision and generation settings
+            registry: Model registry to load from (default: get_registry())
+            backend: "pytorch" (fp32), "int8" (dynamically quantized Linear
+                     layers) or "onnx" (ONNX Runtime); the last two are CPU-only
+            assistant_model: Optional draft model sharing the tokenizer (e.g.
+                             sshleifer/distilbart-cnn-12-6 for bart-large-cnn).
+                             The draft proposes tokens and the main model
+                             verifies several per forward pass. Decoding
+                             becomes greedy (num_beams=1) and one chunk per
+                             call, and the output is identical to greedy
+                             decoding with the main model alone. pytorch
+                             backend only.
         """
         self.model_name = model_name
         self.device = device
+        self.cache = cache
+        self.backend = backend
+        
+        import torch  # imported here so ExtractiveSummarizer works without it
         
         # Check if GPU is available
         if device >= 0 and torch.cuda.is_available():
@@ -25,25 +52,74 @@ class Summarizer:
         else:
             self.device = -1  # Use CPU
         
+        check_backend(backend)  # a missing ONNX runtime must not look like missing transformers
+        registry = registry or get_registry()
         try:
-            self.pipeline = pipeline(
-                "summarization",
-                model=model_name,
-                device=self.device,
-                tokenizer=model_name
-            )
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+            loaded = registry.get(model_name, self.device, backend)
+        except ImportError:
+            raise  # transformers not installed; callers fall back on this
         except Exception as e:
             print(f"Error loading model {model_name}: {e}")
             # Fallback to a smaller model
             fallback_model = "sshleifer/distilbart-cnn-12-6"
             print(f"Trying fallback model: {fallback_model}")
-            self.pipeline = pipeline(
-                "summarization",
-                model=fallback_model,
-                device=self.device
-            )
-            self.tokenizer = AutoTokenizer.from_pretrained(fallback_model)
+            loaded = registry.get(fallback_model, self.device, backend)
+        self.pipeline = loaded.pipeline
+        self.tokenizer = loaded.tokenizer
+        
+        # Identify the model actually loaded (possibly the fallback) for cache keys
+        model = self.pipeline.model
+        revision = getattr(model.config, "_commit_hash", None) or "local"
+        name = getattr(model, "name_or_path", None) or model.config.name_or_path
+        self.model_id = f"{name}@{revision}:{backend}"
+        generation_config = getattr(model, "generation_config", None)
+        self._generation_defaults = generation_config.to_diff_dict() if generation_config else {}
+        self._generation_defaults.pop("transformers_version", None)
+        self.reduction_stats: List[dict] = []  # per level, from the last overall_summary
+        self.generate_calls = 0  # model invocations (not cache hits or short-text shortcuts)
+        
+        self.assistant = None
+        if assistant_model:
+            self.assistant = self._load_assistant(registry, assistant_model)
+    
+    def _load_assistant(self, registry: ModelRegistry, assistant_model: str):
+        """Load the draft model for assisted decoding, or None if unusable."""
+        if self.backend != "pytorch":
+            print(f"Assisted decoding needs the pytorch backend; not using {assistant_model}")
+            return None
+        try:
+            loaded = registry.get(assistant_model, self.device, "pytorch")
+        except Exception as e:
+            print(f"Error loading assistant model {assistant_model}: {e}")
+            return None
+        if loaded.tokenizer.get_vocab() != self.tokenizer.get_vocab():
+            print(f"Assistant model {assistant_model} has a different tokenizer; not using it")
+            return None
+        print(f"Assisted decoding with draft model {assistant_model}")
+        return loaded.pipeline.model
+    
+    def _generate_kwargs(self) -> dict:
+        """Extra generate() arguments for assisted decoding."""
+        if self.assistant is None:
+            return {}
+        return {"assistant_model": self.assistant, "num_beams": 1}
+    
+    def _cache_settings(self, max_length: int, min_length: int) -> dict:
+        settings = {"max_length": max_length, "min_length": min_length, "do_sample": False,
+                    "generation_config": self._generation_defaults}
+        if self.assistant is not None:
+            settings["num_beams"] = 1  # greedy; the draft model does not change the output
+        return settings
+    
+    def _cached_summary(self, text: str, max_length: int, min_length: int) -> Optional[str]:
+        if self.cache is None or not text:
+            return None
+        return self.cache.get_summary(self.model_id, self._cache_settings(max_length, min_length), text)
+    
+    def _store_summary(self, text: str, max_length: int, min_length: int, summary: str):
+        if self.cache is not None and text:
+            self.cache.set_summary(self.model_id, self._cache_settings(max_length, min_length),
+                                   text, summary)
     
     def summarize_chunk(self, text: str, max_length: int = 150, min_length: int = 30) -> str:
         """
@@ -57,69 +133,813 @@ class Summarizer:
         Returns:
             Summarized text
         """
+        cached = self._cached_summary(text, max_length, min_length)
+        if cached is not None:
+            return cached
+        
         try:
             # Tokenize to check length
             tokens = self.tokenizer.encode(text)
             if len(tokens) < 50:  # Very short text
                 return text[:200]  # Just truncate
             
+            self.generate_calls += 1
             summary = self.pipeline(
                 text,
                 max_length=max_length,
                 min_length=min_length,
                 do_sample=False,
-                truncation=True
-            )[0]["summary_text"]
-            return summary.strip()
+                truncation=True,
+                **self._generate_kwargs()
+            )[0]["summary_text"].strip()
+            self._store_summary(text, max_length, min_length, summary)
+            return summary
         except Exception as e:
             print(f"Summarization error: {e}")
             # Fallback: return first 150 characters
             return text[:150] + "..." if len(text) > 150 else text
     
-    def summarize_chunks(self, text: str, chunk_max_chars: int = 1200) -> List[str]:
+    def summarize_ids(self, token_ids: List[int], max_length: int = 150,
+                      min_length: int = 30, text: str = "") -> str:
+        """
+        Summarize a chunk that is already tokenized (see chunk_by_tokens),
+        calling generate() directly so the text is not tokenized again.
+        
+        Args:
+            token_ids: Token ids without special tokens
+            max_length: Maximum summary length
+            min_length: Minimum summary length
+            text: The chunk's text, used for the short-chunk and error fallbacks
+                  and as the summary cache key
+            
+        Returns:
+            Summarized text
+        """
+        cached = self._cached_summary(text, max_length, min_length)
+        if cached is not None:
+            return cached
+        
+        try:
+            if len(token_ids) < 50:  # Very short text
+                return text[:200]
+            
+            import torch
+            input_ids = self.tokenizer.build_inputs_with_special_tokens(token_ids)
+            input_ids = torch.tensor([input_ids], device=self.pipeline.device)
+            self.generate_calls += 1
+            output = self.pipeline.model.generate(
+                input_ids,
+                attention_mask=torch.ones_like(input_ids),
+                max_length=max_length,
+                min_length=min_length,
+                do_sample=False,
+                **self._generate_kwargs()
+            )
+            summary = self.tokenizer.decode(output[0], skip_special_tokens=True).strip()
+            self._store_summary(text, max_length, min_length, summary)
+            return summary
+        except Exception as e:
+            print(f"Summarization error: {e}")
+            return text[:150] + "..." if len(text) > 150 else text
+    
+    def max_input_tokens(self) -> int:
+        """
+        Largest chunk (excluding special tokens) the model accepts.
+        """
+        limit = self.tokenizer.model_max_length
+        max_positions = getattr(self.pipeline.model.config, "max_position_embeddings", None)
+        if max_positions:
+            limit = min(limit, max_positions)
+        return limit - self.tokenizer.num_special_tokens_to_add()
+    
+    def chunk_by_tokens(self, text: str, max_tokens: Optional[int] = None) -> Tuple[List[str], List[List[int]]]:
+        """
+        Pack paragraphs into chunks close to the model's input limit.
+        
+        All paragraphs are tokenized in one batched call of the fast
+        tokenizer, then packed greedily by token count. Packed paragraphs
+        are joined by the tokens of the "\n\n" separator (counted against
+        the budget), so a chunk's ids decode to exactly its text. A
+        paragraph longer than the budget is split on token boundaries.
+        
+        Args:
+            text: Input text
+            max_tokens: Token budget per chunk (default: max_input_tokens())
+            
+        Returns:
+            Tuple of (chunk texts, chunk token ids) in document order
+        """
+        max_tokens = max_tokens or self.max_input_tokens()
+        paragraphs = [p.strip() for p in clean_whitespace(text).split('\n\n') if p.strip()]
+        if not paragraphs:
+            return [], []
+        
+        encoded = self.tokenizer(paragraphs, add_special_tokens=False)["input_ids"]
+        separator = self.tokenizer("\n\n", add_special_tokens=False)["input_ids"]
+        chunks, chunk_ids = [], []
+        current_texts, current_ids = [], []
+        
+        def flush():
+            if current_ids:
+                chunks.append("\n\n".join(current_texts))
+                chunk_ids.append(list(current_ids))
+        
+        for paragraph, ids in zip(paragraphs, encoded):
+            joiner = separator if current_ids else []
+            if len(current_ids) + len(joiner) + len(ids) <= max_tokens:
+                current_texts.append(paragraph)
+                current_ids.extend(joiner)
+                current_ids.extend(ids)
+                continue
+            
+            flush()
+            current_texts, current_ids = [], []
+            if len(ids) <= max_tokens:
+                current_texts, current_ids = [paragraph], list(ids)
+            else:
+                # Oversized paragraph: emit full-budget slices, keep the tail open
+                for start in range(0, len(ids), max_tokens):
+                    piece = ids[start:start + max_tokens]
+                    if len(piece) == max_tokens:
+                        chunks.append(self.tokenizer.decode(piece))
+                        chunk_ids.append(piece)
+                    else:
+                        current_texts, current_ids = [self.tokenizer.decode(piece)], list(piece)
+        
+        flush()
+        return chunks, chunk_ids
+    
+    def summarize_chunks(self, text: str, chunk_max_chars: int = 1200,
+                         chunk_mode: str = "chars", batch_size: int = 1) -> List[str]:
         """
         Summarize text by first chunking it.
         
         Args:
             text: Input text to summarize
-            chunk_max_chars: Maximum characters per chunk
+            chunk_max_chars: Maximum characters per chunk (chunk_mode="chars")
+            chunk_mode: "chars" for character-based chunks, or "tokens" to
+                        pack chunks up to the model's input limit
+            batch_size: Chunks per generate() call (see summarize_chunk_list)
             
         Returns:
             List of slide summaries
         """
+        if chunk_mode == "tokens":
+            chunks, token_ids = self.chunk_by_tokens(text)
+            return self.summarize_chunk_list(chunks, token_ids, batch_size=batch_size)
         chunks = chunk_text(text, max_chars=chunk_max_chars)
-        summaries = []
+        return self.summarize_chunk_list(chunks, batch_size=batch_size)
+    
+    def summarize_chunk_list(self, chunks: List[str],
+                             token_ids: Optional[List[List[int]]] = None,
+                             batch_size: int = 1) -> List[str]:
+        """
+        Summarize already-chunked text, one summary per chunk.
+        
+        Args:
+            chunks: Text chunks (e.g. from chunk_text)
+            token_ids: Optional pre-tokenized ids per chunk (from
+                       chunk_by_tokens), fed straight to generation
+            batch_size: Chunks per generate() call; above 1, chunks are
+                        bucketed by token length (see summarize_batched)
+            
+        Returns:
+            List of slide summaries in chunk order
+        """
+        summaries = [None] * len(chunks)
+        for i, summary in self.iter_chunk_summaries(chunks, token_ids, batch_size=batch_size):
+            summaries[i] = summary
+        return summaries
+    
+    def iter_chunk_summaries(self, chunks: List[str],
+                             token_ids: Optional[List[List[int]]] = None,
+                             batch_size: int = 1) -> Iterator[Tuple[int, str]]:
+        """
+        Streaming variant of summarize_chunk_list.
+        
+        Yields (chunk index, summary) as soon as each chunk (or, with
+        batch_size > 1, each batch) is done, so callers can render slides
+        and narration for early chunks while later ones are still running.
+        With batching, chunks arrive in length-bucket order, not chunk order.
+        
+        Args:
+            chunks: Text chunks (e.g. from chunk_text)
+            token_ids: Optional pre-tokenized ids per chunk
+            batch_size: Chunks per generate() call
+            
+        Yields:
+            Tuples of (chunk index, summary)
+        """
+        if batch_size > 1 and self.assistant is not None:
+            print("Assisted decoding runs one chunk at a time; ignoring batch_size")
+        elif batch_size > 1:
+            yield from self.iter_batched(chunks, token_ids, batch_size=batch_size)
+            return
         
         print(f"Summarizing {len(chunks)} chunks...")
-        for i, chunk in enumerate(chunks, 1):
-            print(f"  Chunk {i}/{len(chunks)} ({len(chunk)} chars)")
-            summary = self.summarize_chunk(chunk)
-            summaries.append(summary)
+        for i, chunk in enumerate(chunks):
+            if token_ids is not None:
+                print(f"  Chunk {i + 1}/{len(chunks)} ({len(token_ids[i])} tokens)")
+                summary = self.summarize_ids(token_ids[i], text=chunk)
+            else:
+                print(f"  Chunk {i + 1}/{len(chunks)} ({len(chunk)} chars)")
+                summary = self.summarize_chunk(chunk)
+            yield i, summary
+    
+    def iter_summaries(self, text: str, chunk_max_chars: int = 1200,
+                       chunk_mode: str = "chars", batch_size: int = 1) -> Iterator[Tuple[int, str]]:
+        """
+        Streaming variant of summarize_chunks / the first level of
+        hierarchical_summary: chunks the text, then yields (index, summary)
+        as chunks complete. Pass the collected summaries to overall_summary
+        for the second level.
+        """
+        if chunk_mode == "tokens":
+            chunks, token_ids = self.chunk_by_tokens(text)
+        else:
+            chunks, token_ids = chunk_text(text, max_chars=chunk_max_chars), None
+        yield from self.iter_chunk_summaries(chunks, token_ids, batch_size=batch_size)
+    
+    def summarize_batched(self, chunks: List[str],
+                          token_ids: Optional[List[List[int]]] = None,
+                          batch_size: int = 8, max_length: int = 150,
+                          min_length: int = 30) -> List[str]:
+        """
+        Summarize chunks in padded batches of similar token length.
+        
+        Chunks found in the summary cache are skipped. The rest are
+        tokenized in one call, sorted by length and cut into batches of
+        batch_size, so each batch pads to nearly the same length.
+        Summaries are returned in the original chunk order. Short chunks get
+        the same truncation fallback as summarize_chunk, and a batch that
+        fails is retried one chunk at a time.
+        
+        Args:
+            chunks: Text chunks
+            token_ids: Optional pre-tokenized ids per chunk, without special
+                       tokens (from chunk_by_tokens)
+            batch_size: Chunks per generate() call
+            max_length: Maximum summary length
+            min_length: Minimum summary length
+            
+        Returns:
+            List of summaries in chunk order
+        """
+        summaries = [None] * len(chunks)
+        for i, summary in self.iter_batched(chunks, token_ids, batch_size, max_length, min_length):
+            summaries[i] = summary
+        return summaries
+    
+    def iter_batched(self, chunks: List[str],
+                     token_ids: Optional[List[List[int]]] = None,
+                     batch_size: int = 8, max_length: int = 150,
+                     min_length: int = 30) -> Iterator[Tuple[int, str]]:
+        """
+        Generator behind summarize_batched: yields (chunk index, summary)
+        for cached and short chunks first, then for each batch as it finishes.
+        """
+        cached = [self._cached_summary(chunk, max_length, min_length) for chunk in chunks]
+        uncached = []
+        for i, summary in enumerate(cached):
+            if summary is None:
+                uncached.append(i)
+            else:
+                yield i, summary
+        if not uncached:
+            return
+        
+        inputs = {}
+        if token_ids is not None:
+            for i in uncached:
+                inputs[i] = self.tokenizer.build_inputs_with_special_tokens(token_ids[i])
+            lengths = {i: len(token_ids[i]) for i in uncached}
+        else:
+            encoded = self.tokenizer([chunks[i] for i in uncached], truncation=True)["input_ids"]
+            inputs = dict(zip(uncached, encoded))
+            lengths = {i: len(ids) for i, ids in inputs.items()}
+        
+        pending = []
+        for i in uncached:
+            if lengths[i] < 50:  # Very short text
+                yield i, chunks[i][:200]
+            else:
+                pending.append(i)
+        
+        # Longest first, so the first batch shows the peak memory use early
+        pending.sort(key=lambda i: len(inputs[i]), reverse=True)
+        batches = [pending[start:start + batch_size]
+                   for start in range(0, len(pending), batch_size)]
+        
+        print(f"Summarizing {len(pending)} chunks in {len(batches)} batches of up to {batch_size} "
+              f"({len(chunks) - len(uncached)} cached)...")
+        for n, batch in enumerate(batches, 1):
+            print(f"  Batch {n}/{len(batches)} ({len(batch)} chunks, "
+                  f"{len(inputs[batch[0]])} tokens max)")
+            try:
+                padded = self.tokenizer.pad({"input_ids": [inputs[i] for i in batch]},
+                                            return_tensors="pt")
+                self.generate_calls += 1
+                output = self.pipeline.model.generate(
+                    padded["input_ids"].to(self.pipeline.device),
+                    attention_mask=padded["attention_mask"].to(self.pipeline.device),
+                    max_length=max_length,
+                    min_length=min_length,
+                    do_sample=False
+                )
+                texts = [text.strip() for text in
+                         self.tokenizer.batch_decode(output, skip_special_tokens=True)]
+                for i, summary in zip(batch, texts):
+                    self._store_summary(chunks[i], max_length, min_length, summary)
+            except Exception as e:
+                print(f"Batch summarization error: {e}; retrying chunks one at a time")
+                texts = [self.summarize_chunk(chunks[i], max_length, min_length) for i in batch]
+            yield from zip(batch, texts)
+    
+    def summarize_pages(self, pages: Iterable[str], chunk_max_chars: int = 1200) -> List[str]:
+        """
+        Summarize a stream of page texts without joining them first.
+        
+        Chunks are built incrementally with utils.iter_chunks, so the first
+        chunk is summarized while later pages are still being extracted.
+        
+        Args:
+            pages: Iterable of raw page texts (e.g. extractor.iter_pages)
+            chunk_max_chars: Maximum characters per chunk
+            
+        Returns:
+            List of slide summaries
+        """
+        summaries = []
+        
+        print("Summarizing chunks as pages are extracted...")
+        for i, chunk in enumerate(iter_chunks(pages, max_chars=chunk_max_chars), 1):
+            print(f"  Chunk {i} ({len(chunk)} chars)")
+            summaries.append(self.summarize_chunk(chunk))
         
         return summaries
     
-    def hierarchical_summary(self, text: str, chunk_max_chars: int = 1200) -> Tuple[List[str], str]:
+    def hierarchical_summary(self, text: str, chunk_max_chars: int = 1200,
+                             chunk_mode: str = "chars", batch_size: int = 1) -> Tuple[List[str], str]:
         """
         Two-level summarization: chunk summaries + overall summary.
         
         Args:
             text: Input text
             chunk_max_chars: Maximum characters per chunk
+            chunk_mode: "chars" or "tokens" (see summarize_chunks)
+            batch_size: Chunks per generate() call (see summarize_chunk_list)
             
         Returns:
             Tuple of (slide summaries, overall summary)
         """
         # First level: summarize chunks for slides
-        slide_summaries = self.summarize_chunks(text, chunk_max_chars)
+        slide_summaries = self.summarize_chunks(text, chunk_max_chars, chunk_mode=chunk_mode,
+                                                batch_size=batch_size)
+        
+        # Second level: reduce slide summaries to an overall summary
+        overall_summary = self.overall_summary(slide_summaries, batch_size=batch_size)
+        
+        return slide_summaries, overall_summary
+    
+    def group_summaries(self, summaries: List[str],
+                        max_tokens: Optional[int] = None) -> List[List[int]]:
+        """
+        Pack consecutive summaries into groups that fit the model's input.
+        
+        Args:
+            summaries: Summaries in document order
+            max_tokens: Token budget per group (default: max_input_tokens())
+            
+        Returns:
+            Groups of summary indices, in document order
+        """
+        budget = max_tokens or self.max_input_tokens()
+        counts = [len(ids) for ids in
+                  self.tokenizer(summaries, add_special_tokens=False)["input_ids"]]
+        groups = []
+        current, size = [], 0
+        for i, count in enumerate(counts):
+            if current and size + count + 1 > budget:
+                groups.append(current)
+                current, size = [], 0
+            current.append(i)
+            size += count + 1  # +1 for the joining space
+        if current:
+            groups.append(current)
+        return groups
+    
+    def overall_summary(self, slide_summaries: List[str], batch_size: int = 1) -> str:
+        """
+        Summarize the slide summaries into one overall summary.
+        
+        Summaries that do not fit the model's input together are reduced
+        as a tree (see reduce_summaries) rather than truncated.
         
-        # Second level: create overall summary from slide summaries
+        Args:
+            slide_summaries: Per-slide summaries
+            batch_size: Groups per generate() call at each reduction level
+            
+        Returns:
+            Overall summary text
+        """
         combined_summaries = " ".join(slide_summaries)
         if len(combined_summaries) > 500:
-            overall_summary = self.summarize_chunk(combined_summaries, max_length=200, min_length=50)
-        else:
-            overall_summary = combined_summaries[:300] + "..." if len(combined_summaries) > 300 else combined_summaries
+            return reduce_summaries(self, slide_summaries, batch_size=batch_size)
+        return combined_summaries[:300] + "..." if len(combined_summaries) > 300 else combined_summaries
+
+def reduce_summaries(summarizer, summaries: List[str], batch_size: int = 1,
+                     max_length: int = 200, min_length: int = 50) -> str:
+    """
+    Map-reduce summaries into one, for documents of any length.
+    
+    Summaries are packed into groups that fit the model's input, every
+    group is summarized (all groups of a level in one summarize_chunk_list
+    call, so they are batched or spread across workers), and the results
+    are reduced again until everything fits one final call. Each level
+    shrinks the count by the fan-in, so the total is O(n) model calls and
+    the critical path is the tree depth, logarithmic in n. Per-level
+    timings are printed and kept in summarizer.reduction_stats.
+    
+    Args:
+        summarizer: Summarizer or ShardedSummarizer
+        summaries: Slide summaries in document order
+        batch_size: Groups per generate() call at each level
+        max_length: Maximum length of the final summary
+        min_length: Minimum length of the final summary
         
-        return slide_summaries, overall_summary
+    Returns:
+        Overall summary text
+    """
+    level = [summary for summary in summaries if summary.strip()]
+    stats = []
+    while len(level) > 1:
+        groups = summarizer.group_summaries(level)
+        if len(groups) == 1:
+            break
+        if len(groups) == len(level):
+            print("  Summaries too long to group; the final summary input will be truncated")
+            break
+        start = time.perf_counter()
+        level = summarizer.summarize_chunk_list(
+            [" ".join(level[i] for i in group) for group in groups], batch_size=batch_size)
+        stats.append({"inputs": sum(len(group) for group in groups), "groups": len(groups),
+                      "fan_in": max(len(group) for group in groups),
+                      "seconds": time.perf_counter() - start})
+    
+    start = time.perf_counter()
+    overall = summarizer.summarize_chunk(" ".join(level), max_length, min_length)
+    stats.append({"inputs": len(level), "groups": 1, "fan_in": len(level),
+                  "seconds": time.perf_counter() - start})
+    summarizer.reduction_stats = stats
+    
+    calls = sum(level_stats["groups"] for level_stats in stats)
+    print(f"  Overall summary: {len(summaries)} summaries, depth {len(stats)}, "
+          f"{calls} model calls")
+    for depth, level_stats in enumerate(stats, 1):
+        print(f"    Level {depth}: {level_stats['inputs']} -> {level_stats['groups']} "
+              f"(fan-in up to {level_stats['fan_in']}) in {level_stats['seconds']:.1f}s")
+    return overall
+
+# Per-process Summarizer for ShardedSummarizer workers
+_worker_summarizer = None
+
+def _init_summarizer_worker(model_name: str, backend: str, threads: int,
+                            cache: Optional[SummaryCache], assistant_model: Optional[str]):
+    """Pin the worker's thread count, then load its own copy of the model."""
+    global _worker_summarizer
+    import torch
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+    os.environ["MKL_NUM_THREADS"] = str(threads)
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # already fixed once parallel work has started
+    _worker_summarizer = Summarizer(model_name=model_name, cache=cache, backend=backend,
+                                    assistant_model=assistant_model)
+
+def _summarize_shard(task: Tuple[int, List[str], Optional[List[List[int]]], int]):
+    """Summarize one shard of chunks in a worker."""
+    start_index, chunks, token_ids, batch_size = task
+    start = time.perf_counter()
+    summaries = _worker_summarizer.summarize_chunk_list(chunks, token_ids, batch_size=batch_size)
+    return start_index, summaries, os.getpid(), time.perf_counter() - start
+
+def _call_worker(method: str, *args):
+    """Run any other Summarizer method in a worker."""
+    return getattr(_worker_summarizer, method)(*args)
+
+class ShardedSummarizer:
+    """
+    Summarizer that shards chunks across worker processes.
+    
+    Each worker pins its torch thread count and loads its own copy of the
+    model (from memory-mapped safetensors weights where available), so a
+    many-core machine runs several small inferences in parallel instead of
+    one inference that stops scaling after a few threads. Exposes the same
+    chunk_by_tokens / summarize_chunk_list / overall_summary interface as
+    Summarizer. Use as a context manager, or call close().
+    """
+    
+    def __init__(self, model_name: str = "facebook/bart-large-cnn", workers: Optional[int] = None,
+                 threads_per_worker: Optional[int] = None, cache: Optional[SummaryCache] = None,
+                 backend: str = "pytorch", shard_size: int = 4,
+                 assistant_model: Optional[str] = None):
+        """
+        Args:
+            model_name: HuggingFace model name
+            workers: Worker processes (default: CPU count // 4, at least 1)
+            threads_per_worker: Torch threads per worker (default: CPU count
+                                divided evenly between workers)
+            cache: Optional summary cache shared by all workers
+            backend: "pytorch", "int8" or "onnx" (see Summarizer)
+            shard_size: Chunks handed to a worker at a time; small shards
+                        balance load, larger ones allow batching
+            assistant_model: Optional draft model (see Summarizer)
+        """
+        # Workers import these in the pool initializer, where a failure only
+        # surfaces as BrokenProcessPool; check here so callers get ImportError
+        for module in ("torch", "transformers"):
+            if importlib.util.find_spec(module) is None:
+                raise ImportError(f"No module named '{module}'")
+        check_backend(backend)
+        
+        cpus = os.cpu_count() or 1
+        self.model_name = model_name
+        self.workers = workers or max(1, cpus // 4)
+        self.threads_per_worker = threads_per_worker or max(1, cpus // self.workers)
+        self.shard_size = shard_size
+        self.worker_stats = {}
+        self.reduction_stats: List[dict] = []
+        
+        print(f"Starting {self.workers} summarization workers "
+              f"({self.threads_per_worker} threads each)...")
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_summarizer_worker,
+            initargs=(model_name, backend, self.threads_per_worker, cache, assistant_model)
+        )
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        self._executor.shutdown()
+    
+    def chunk_by_tokens(self, text: str, max_tokens: Optional[int] = None):
+        """See Summarizer.chunk_by_tokens (runs in a worker)."""
+        return self._executor.submit(_call_worker, "chunk_by_tokens", text, max_tokens).result()
+    
+    def summarize_chunk(self, text: str, max_length: int = 150, min_length: int = 30) -> str:
+        """See Summarizer.summarize_chunk (runs in a worker)."""
+        return self._executor.submit(_call_worker, "summarize_chunk", text,
+                                     max_length, min_length).result()
+    
+    def group_summaries(self, summaries: List[str],
+                        max_tokens: Optional[int] = None) -> List[List[int]]:
+        """See Summarizer.group_summaries (runs in a worker)."""
+        return self._executor.submit(_call_worker, "group_summaries", summaries,
+                                     max_tokens).result()
+    
+    def overall_summary(self, slide_summaries: List[str], batch_size: int = 1) -> str:
+        """
+        See Summarizer.overall_summary; each reduction level is sharded
+        across the workers.
+        """
+        combined_summaries = " ".join(slide_summaries)
+        if len(combined_summaries) > 500:
+            return reduce_summaries(self, slide_summaries, batch_size=batch_size)
+        return combined_summaries[:300] + "..." if len(combined_summaries) > 300 else combined_summaries
+    
+    def summarize_chunk_list(self, chunks: List[str],
+                             token_ids: Optional[List[List[int]]] = None,
+                             batch_size: int = 1) -> List[str]:
+        """
+        Summarize chunks across the workers.
+        
+        Args:
+            chunks: Text chunks
+            token_ids: Optional pre-tokenized ids per chunk
+            batch_size: Batch size within each worker (see Summarizer)
+            
+        Returns:
+            List of summaries in chunk order; per-worker throughput of
+            this call is printed and kept in self.worker_stats
+        """
+        summaries = [None] * len(chunks)
+        for i, summary in self.iter_chunk_summaries(chunks, token_ids, batch_size=batch_size):
+            summaries[i] = summary
+        return summaries
+    
+    def iter_chunk_summaries(self, chunks: List[str],
+                             token_ids: Optional[List[List[int]]] = None,
+                             batch_size: int = 1) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (chunk index, summary) as each shard completes, in completion
+        order. Per-worker throughput for this call is printed once all
+        shards are done.
+        """
+        self.worker_stats = {}
+        shard_size = max(self.shard_size, batch_size)
+        futures = []
+        for start in range(0, len(chunks), shard_size):
+            ids = token_ids[start:start + shard_size] if token_ids is not None else None
+            task = (start, chunks[start:start + shard_size], ids, batch_size)
+            futures.append(self._executor.submit(_summarize_shard, task))
+        
+        print(f"Summarizing {len(chunks)} chunks in {len(futures)} shards "
+              f"across {self.workers} workers...")
+        start = time.perf_counter()
+        for future in as_completed(futures):
+            start_index, shard, pid, seconds = future.result()
+            stats = self.worker_stats.setdefault(pid, {"chunks": 0, "seconds": 0.0})
+            stats["chunks"] += len(shard)
+            stats["seconds"] += seconds
+            yield from enumerate(shard, start_index)
+        elapsed = time.perf_counter() - start
+        
+        for n, (pid, stats) in enumerate(sorted(self.worker_stats.items()), 1):
+            rate = stats["chunks"] / stats["seconds"] if stats["seconds"] else 0.0
+            print(f"  Worker {n} (pid {pid}): {stats['chunks']} chunks in "
+                  f"{stats['seconds']:.1f}s ({rate:.2f} chunks/s)")
+        if elapsed:
+            print(f"  Total: {len(chunks) / elapsed:.2f} chunks/s")
+
+_TERM_RE = re.compile(r"[a-z][a-z0-9'-]+")
+
+_STOPWORDS = frozenset("""
+    a about above after again against all also am an and any are as at be because been
+    before being below between both but by can could did do does doing down during each
+    few for from further had has have having he her here hers him his how however i if in
+    into is it its itself just may me might more most much must my no nor not now of off
+    on once only or other our ours out over own same she should so some such than that the
+    their theirs them then there these they this those through thus to too under until up
+    upon us very was we were what when where which while who whom why will with would you
+    your yours
+""".split())
+
+class ExtractiveSummarizer:
+    """
+    Fast extractive summarization without a model: picks the sentences of
+    each chunk that are closest to the chunk's TF-IDF centroid.
+    
+    All sentences of the document are scored in one vectorized pass over
+    sparse (coordinate-format) NumPy arrays, so a 500-page document takes
+    seconds on CPU. Same interface as Summarizer.
+    """
+    
+    def __init__(self, sentences_per_chunk: int = 2, overall_sentences: int = 4,
+                 min_words: int = 4):
+        """
+        Args:
+            sentences_per_chunk: Sentences kept per chunk summary
+            overall_sentences: Sentences kept in the overall summary
+            min_words: Sentences with fewer content words are only picked
+                       when a chunk has nothing longer
+        """
+        import numpy  # fail at construction, like Summarizer without transformers
+        
+        self.model_name = "extractive"
+        self.sentences_per_chunk = sentences_per_chunk
+        self.overall_sentences = overall_sentences
+        self.min_words = min_words
+    
+    def score_sentences(self, chunks: List[str]) -> Tuple[List[List[Tuple[int, int]]], list]:
+        """
+        Centroid scores for every sentence of every chunk.
+        
+        Args:
+            chunks: Text chunks
+            
+        Returns:
+            Tuple of (sentence spans per chunk, scores per chunk as NumPy arrays)
+        """
+        import numpy as np
+        
+        spans = [sentence_spans(chunk) for chunk in chunks]
+        vocabulary = {}
+        rows, cols, chunk_of_sentence = [], [], []
+        n_sentences = 0
+        for c, (chunk, chunk_spans) in enumerate(zip(chunks, spans)):
+            for start, end in chunk_spans:
+                for term in _TERM_RE.findall(chunk[start:end].lower()):
+                    if term not in _STOPWORDS:
+                        rows.append(n_sentences)
+                        cols.append(vocabulary.setdefault(term, len(vocabulary)))
+                chunk_of_sentence.append(c)
+                n_sentences += 1
+        
+        scores = np.zeros(n_sentences)
+        if rows:
+            n_terms = len(vocabulary)
+            rows = np.asarray(rows, dtype=np.int64)
+            cols = np.asarray(cols, dtype=np.int64)
+            chunk_of_sentence = np.asarray(chunk_of_sentence, dtype=np.int64)
+            
+            # Sparse sentence-term counts: unique (sentence, term) pairs
+            pairs, tf = np.unique(rows * n_terms + cols, return_counts=True)
+            rows, cols = pairs // n_terms, pairs % n_terms
+            
+            # Sublinear TF-IDF, L2-normalized per sentence
+            df = np.bincount(cols, minlength=n_terms)
+            idf = np.log((n_sentences + 1) / (df + 1)) + 1
+            weights = (1 + np.log(tf)) * idf[cols]
+            norms = np.sqrt(np.bincount(rows, weights=weights ** 2, minlength=n_sentences))
+            weights /= norms[rows]
+            
+            # Each chunk's centroid, then every sentence's dot product with it
+            keys = chunk_of_sentence[rows] * n_terms + cols
+            _, inverse = np.unique(keys, return_inverse=True)
+            centroid = np.bincount(inverse, weights=weights)
+            scores = np.bincount(rows, weights=weights * centroid[inverse], minlength=n_sentences)
+            
+            words = np.bincount(rows, minlength=n_sentences)
+            scores[words < self.min_words] *= 1e-3
+        
+        per_chunk = []
+        offset = 0
+        for chunk_spans in spans:
+            per_chunk.append(scores[offset:offset + len(chunk_spans)])
+            offset += len(chunk_spans)
+        return spans, per_chunk
+    
+    def _select(self, chunk: str, chunk_spans, scores, count: int) -> str:
+        if not chunk_spans:
+            return chunk[:200]
+        best = sorted(sorted(range(len(chunk_spans)), key=lambda i: -scores[i])[:count])
+        return " ".join(chunk[chunk_spans[i][0]:chunk_spans[i][1]] for i in best)
+    
+    def summarize_chunk_list(self, chunks: List[str],
+                             token_ids: Optional[List[List[int]]] = None,
+                             batch_size: int = 1) -> List[str]:
+        """
+        Summarize already-chunked text, one summary per chunk.
+        
+        Args:
+            chunks: Text chunks
+            token_ids: Ignored (accepted for interface compatibility)
+            batch_size: Ignored (accepted for interface compatibility)
+            
+        Returns:
+            List of slide summaries in chunk order
+        """
+        spans, scores = self.score_sentences(chunks)
+        return [self._select(chunk, chunk_spans, chunk_scores, self.sentences_per_chunk)
+                for chunk, chunk_spans, chunk_scores in zip(chunks, spans, scores)]
+    
+    def iter_chunk_summaries(self, chunks: List[str],
+                             token_ids: Optional[List[List[int]]] = None,
+                             batch_size: int = 1) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (chunk index, summary); all chunks are scored in one pass, so
+        everything arrives at once.
+        """
+        yield from enumerate(self.summarize_chunk_list(chunks))
+    
+    def summarize_chunk(self, text: str, max_length: int = 150, min_length: int = 30) -> str:
+        """
+        Summarize a single chunk of text (lengths are ignored).
+        """
+        return self.summarize_chunk_list([text])[0]
+    
+    def summarize_chunks(self, text: str, chunk_max_chars: int = 1200,
+                         chunk_mode: str = "chars", batch_size: int = 1) -> List[str]:
+        """
+        Summarize text by first chunking it.
+        
+        Args:
+            text: Input text to summarize
+            chunk_max_chars: Maximum characters per chunk
+            chunk_mode: Only "chars" applies; there is no tokenizer
+            batch_size: Ignored (accepted for interface compatibility)
+            
+        Returns:
+            List of slide summaries
+        """
+        return self.summarize_chunk_list(chunk_text(text, max_chars=chunk_max_chars))
+    
+    def hierarchical_summary(self, text: str, chunk_max_chars: int = 1200,
+                             chunk_mode: str = "chars", batch_size: int = 1) -> Tuple[List[str], str]:
+        """
+        Two-level summarization: chunk summaries + overall summary.
+        
+        Returns:
+            Tuple of (slide summaries, overall summary)
+        """
+        slide_summaries = self.summarize_chunks(text, chunk_max_chars)
+        return slide_summaries, self.overall_summary(slide_summaries)
+    
+    def overall_summary(self, slide_summaries: List[str], batch_size: int = 1) -> str:
+        """
+        The slide-summary sentences closest to the centroid of all of them
+        (batch_size is accepted for interface compatibility and ignored).
+        """
+        combined = "\n\n".join(slide_summaries)
+        spans, scores = self.score_sentences([combined])
+        return self._select(combined, spans[0], scores[0], self.overall_sentences)
 
 class OpenAISummarizer:
     """
@@ -87,6 +87,18 @@ def group_texts_to_single_audio(texts: List[str], output_path: str,
     else:
         raise ValueError(f"Unsupported TTS method: {method}")
 
+def concatenate_audio(audio_files: List[str], output_path: str) -> str:
+    """
+    Join per-slide audio files into a single narration track.
+    """
+    from pydub import AudioSegment
+    
+    combined = AudioSegment.empty()
+    for audio_file in audio_files:
+        combined += AudioSegment.from_file(audio_file)
+    combined.export(output_path, format=os.path.splitext(output_path)[1].lstrip(".") or "mp3")
+    return output_path
+
 # Add alias functions for backward compatibility
 tts_pyttsx3_windows = tts_pyttsx3
 tts_pyttsx3_fallback = tts_pyttsx3
\ No newline at end of file
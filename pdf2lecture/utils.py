@@ -1,7 +1,32 @@
 import re
 import math
+import hashlib
+from functools import lru_cache
 from textwrap import wrap
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+# One pass over the text: blank-line runs become a paragraph break, lone
+# carriage returns become newlines, and runs of spaces/tabs collapse.
+# Equivalent to the three sequential substitutions it replaced.
+_WHITESPACE_RE = re.compile(r'[\r\n]\s*[\r\n]|\r|[ \t]+')
+
+# Same as above, plus joining words hyphenated across a line break
+_DOCUMENT_RE = re.compile(r'(?<=[a-z])-[ \t]*\r?\n[ \t]*(?=[a-z])|[\r\n]\s*[\r\n]|\r|[ \t]+')
+
+# Lines that are only a page number: "12", "Page 12", "12 of 40", "- 12 -"
+_PAGE_NUMBER_RE = re.compile(r'^[\s\-–—]*(page\s*)?\d+(\s*(of|/)\s*\d+)?[\s\-–—]*$', re.IGNORECASE)
+
+_DIGITS_RE = re.compile(r'\d+')
+
+def _normalize_whitespace(match) -> str:
+    token = match.group(0)
+    if token[0] in ' \t':
+        return ' '
+    if token == '\r':
+        return '\n'
+    if token[0] == '-':
+        return ''  # hyphenated line break
+    return '\n\n'
 
 def clean_whitespace(text: str) -> str:
     """
@@ -13,13 +38,95 @@ def clean_whitespace(text: str) -> str:
     Returns:
         Cleaned text with normalized spacing
     """
-    # Replace carriage returns with newlines
-    text = re.sub(r'\r', '\n', text)
-    # Collapse multiple newlines
-    text = re.sub(r'\n\s*\n+', '\n\n', text)
-    # Collapse multiple spaces/tabs
-    text = re.sub(r'[ \t]+', ' ', text)
-    return text.strip()
+    return _WHITESPACE_RE.sub(_normalize_whitespace, text).strip()
+
+def clean_document(pages: List[str], edge_lines: int = 3, min_repeat_ratio: float = 0.5,
+                   tokenizer=None, max_removed_ratio: float = 0.5) -> Tuple[str, dict]:
+    """
+    Document-level cleaning: strip running headers/footers and page numbers,
+    join hyphenated words, and normalize whitespace.
+    
+    A line near the top or bottom of a page is treated as boilerplate if,
+    with digits ignored, it appears on at least min_repeat_ratio of the
+    pages (and on at least two). Page-number-only lines in those regions
+    are always removed. Pages with at most 2 * edge_lines lines (typical
+    of slide decks) have no header/footer region and are kept whole. If
+    cleaning would remove more than max_removed_ratio of the characters,
+    a warning is printed and only whitespace is normalized.
+    
+    Args:
+        pages: Raw text of each page, in order
+        edge_lines: How many lines at each end of a page count as header/footer
+        min_repeat_ratio: Fraction of pages a line must repeat on
+        tokenizer: Optional HF tokenizer for exact token counts (default:
+                   whitespace-separated words)
+        max_removed_ratio: Fraction of characters above which the cleaning
+                           is considered wrong and undone
+        
+    Returns:
+        Tuple of (cleaned text, stats) where stats has "chars_removed",
+        "tokens_removed", "boilerplate_lines" and "hyphens_joined"
+    """
+    def key(line: str) -> str:
+        return _DIGITS_RE.sub('#', ' '.join(line.split()).lower())
+    
+    page_lines = [page.splitlines() for page in pages]
+    
+    # Count on how many pages each normalized edge line occurs
+    counts = {}
+    for lines in page_lines:
+        if len(lines) <= 2 * edge_lines:
+            continue  # too short to have a header/footer region
+        edges = {key(line) for line in lines[:edge_lines] + lines[-edge_lines:] if line.strip()}
+        for k in edges:
+            counts[k] = counts.get(k, 0) + 1
+    threshold = max(2, min_repeat_ratio * len(pages))
+    repeated = {k for k, count in counts.items() if count >= threshold}
+    
+    kept_pages = []
+    boilerplate_lines = 0
+    for lines in page_lines:
+        kept = []
+        has_edges = len(lines) > 2 * edge_lines
+        for i, line in enumerate(lines):
+            at_edge = has_edges and (i < edge_lines or i >= len(lines) - edge_lines)
+            if at_edge and line.strip() and (key(line) in repeated or _PAGE_NUMBER_RE.match(line)):
+                boilerplate_lines += 1
+                continue
+            kept.append(line)
+        kept_pages.append('\n'.join(kept).strip())
+    
+    joined = '\n\n'.join(page for page in kept_pages if page)
+    hyphens_joined = 0
+    
+    def substitute(match):
+        nonlocal hyphens_joined
+        if match.group(0)[0] == '-':
+            hyphens_joined += 1
+        return _normalize_whitespace(match)
+    
+    cleaned = _DOCUMENT_RE.sub(substitute, joined).strip()
+    
+    original = '\n\n'.join(pages)
+    if len(original) - len(cleaned) > max_removed_ratio * len(original):
+        print(f"Warning: header/footer cleaning would remove "
+              f"{len(original) - len(cleaned)} of {len(original)} characters; "
+              f"keeping the text with whitespace normalized only")
+        cleaned = clean_whitespace(original)
+        boilerplate_lines = hyphens_joined = 0
+    
+    if tokenizer is not None:
+        count_tokens = lambda t: len(tokenizer(t, add_special_tokens=False)["input_ids"])
+    else:
+        count_tokens = lambda t: len(t.split())
+    
+    stats = {
+        "chars_removed": len(original) - len(cleaned),
+        "tokens_removed": count_tokens(original) - count_tokens(cleaned),
+        "boilerplate_lines": boilerplate_lines,
+        "hyphens_joined": hyphens_joined,
+    }
+    return cleaned, stats
 
 def chunk_text(text: str, max_chars: int = 1200) -> List[str]:
     """
@@ -33,7 +140,42 @@ def chunk_text(text: str, max_chars: int = 1200) -> List[str]:
         List of text chunks
     """
     paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-    chunks = []
+    return list(_pack_paragraphs(paragraphs, max_chars))
+
+def iter_chunks(pages: Union[str, Iterable[str]], max_chars: int = 1200) -> Iterator[str]:
+    """
+    Streaming version of clean_whitespace + chunk_text over an iterable of pages.
+    
+    Each page is cleaned and split into paragraphs as it arrives, and a chunk
+    is yielded as soon as it is complete, so only the current chunk is held
+    in memory. Produces the same chunks as
+    chunk_text(clean_whitespace("\n\n".join(pages)), max_chars).
+    Runs in time linear in the input length.
+    
+    Args:
+        pages: Iterable of raw page texts (e.g. extractor.iter_pages), or a
+               single string
+        max_chars: Maximum characters per chunk
+        
+    Returns:
+        Iterator over text chunks
+    """
+    if isinstance(pages, str):
+        pages = [pages]
+    
+    def paragraphs():
+        for page in pages:
+            for paragraph in clean_whitespace(page).split('\n\n'):
+                paragraph = paragraph.strip()
+                if paragraph:
+                    yield paragraph
+    
+    return _pack_paragraphs(paragraphs(), max_chars)
+
+def _pack_paragraphs(paragraphs: Iterable[str], max_chars: int) -> Iterator[str]:
+    """
+    Greedily pack paragraphs into chunks of at most max_chars characters.
+    """
     current_chunk = ""
     
     for paragraph in paragraphs:
@@ -46,32 +188,236 @@ def chunk_text(text: str, max_chars: int = 1200) -> List[str]:
         else:
             # Save current chunk if it's not empty
             if current_chunk:
-                chunks.append(current_chunk)
+                yield current_chunk
             
             # Handle very long paragraphs
             if len(paragraph) <= max_chars:
                 current_chunk = paragraph
             else:
-                # Split long paragraph into smaller chunks
-                words = paragraph.split()
+                # Split long paragraph into smaller chunks, tracking the
+                # joined length instead of re-joining the words for each one
                 current_words = []
+                current_len = 0
                 
-                for word in words:
-                    if len(' '.join(current_words + [word])) <= max_chars:
+                for word in paragraph.split():
+                    new_len = current_len + len(word) + (1 if current_words else 0)
+                    if new_len <= max_chars:
                         current_words.append(word)
+                        current_len = new_len
                     else:
                         if current_words:
-                            chunks.append(' '.join(current_words))
+                            yield ' '.join(current_words)
                         current_words = [word]
+                        current_len = len(word)
                 
                 if current_words:
-                    chunks.append(' '.join(current_words))
+                    yield ' '.join(current_words)
                 current_chunk = ""
     
     if current_chunk:
-        chunks.append(current_chunk)
+        yield current_chunk
+
+def parse_page_range(spec: str, page_count: int) -> List[int]:
+    """
+    Parse a 1-based page specification such as "120-180", "1-3,7,10-" or "-5".
+    
+    Args:
+        spec: Comma-separated pages and inclusive ranges; open ends allowed
+        page_count: Total number of pages in the document
+        
+    Returns:
+        Sorted, de-duplicated 0-based page indices within the document
+    """
+    selected = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start_str, end_str = part.split('-', 1)
+            start = int(start_str) if start_str.strip() else 1
+            end = int(end_str) if end_str.strip() else page_count
+        else:
+            start = end = int(part)
+        if start < 1 or end < start:
+            raise ValueError(f"Invalid page range: {part!r}")
+        selected.update(range(start - 1, min(end, page_count)))
+    return sorted(selected)
+
+def select_pages(page_count: int, pages: Union[str, Iterable[int], None] = None,
+                 max_pages: Optional[int] = None, sample: Optional[int] = None) -> List[int]:
+    """
+    Choose which pages to extract.
     
-    return chunks
+    Args:
+        page_count: Total number of pages in the document
+        pages: Page spec string (see parse_page_range) or iterable of
+               1-based page numbers; None selects every page
+        max_pages: Keep only the first max_pages of the selection
+        sample: Keep this many pages evenly spaced across the selection
+        
+    Returns:
+        Sorted 0-based page indices
+    """
+    if pages is None:
+        selected = list(range(page_count))
+    elif isinstance(pages, str):
+        selected = parse_page_range(pages, page_count)
+    else:
+        selected = sorted({p - 1 for p in pages if 1 <= p <= page_count})
+    
+    if sample and sample < len(selected):
+        selected = [selected[i * len(selected) // sample] for i in range(sample)]
+    if max_pages is not None:
+        selected = selected[:max_pages]
+    
+    return selected
+
+# Candidate sentence ends: terminal punctuation (plus closing quotes or
+# brackets) followed by whitespace or end of text, or a blank line. A period
+# inside a number ("2.5") or a dotted abbreviation ("e.g") never matches.
+_SENTENCE_END_RE = re.compile(r'[.!?]+["\'\)\]]*(?=\s|\Z)|\n[ \t]*\n')
+
+# Words that end in a period without ending the sentence
+_ABBREVIATIONS = frozenset("""
+    mr mrs ms dr prof sr jr st vs e.g i.e cf al approx fig figs eq eqs
+    no nos vol vols p pp ch chap sec sect ed eds dept univ inc ltd co corp
+    jan feb mar apr jun jul aug sep sept oct nov dec
+""".split())
+
+@lru_cache(maxsize=4096)
+def sentence_spans(text: str) -> Tuple[Tuple[int, int], ...]:
+    """
+    Segment text into sentences, returning (start, end) character offsets.
+    
+    A single compiled scan over the text. Decimals, dotted abbreviations
+    (e.g., i.e., Fig.), initials and ends followed by a lowercase word are
+    not treated as boundaries; blank lines always are. Results are cached
+    per text, so every stage that segments the same chunk shares one scan.
+    
+    Args:
+        text: Text to segment
+        
+    Returns:
+        Tuple of (start, end) offsets with surrounding whitespace excluded,
+        so text[start:end] is a sentence including its punctuation
+    """
+    spans = []
+    start = 0
+    length = len(text)
+    
+    def add(end):
+        s, e = start, end
+        while s < e and text[s].isspace():
+            s += 1
+        while e > s and text[e - 1].isspace():
+            e -= 1
+        if s < e:
+            spans.append((s, e))
+    
+    for match in _SENTENCE_END_RE.finditer(text):
+        end = match.end()
+        if text[match.start()] != '\n':
+            # Next non-space character; lowercase means the sentence continues
+            following = end
+            while following < length and text[following].isspace():
+                following += 1
+            if following < length and text[following].islower():
+                continue
+            
+            if '!' not in match.group() and '?' not in match.group():
+                word_start = max(text.rfind(' ', 0, match.start()),
+                                 text.rfind('\n', 0, match.start())) + 1
+                word = text[word_start:match.start()].lstrip('(["\'').lower()
+                if word in _ABBREVIATIONS or (len(word) == 1 and word.isalpha()):
+                    continue
+        add(end)
+        start = end
+    
+    add(length)
+    return tuple(spans)
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences (see sentence_spans).
+    
+    Args:
+        text: Text to segment
+        
+    Returns:
+        List of sentences with their punctuation
+    """
+    return [text[s:e] for s, e in sentence_spans(text)]
+
+_WORD_RE = re.compile(r'\w+')
+
+def simhash(text: str, bits: int = 64, shingle_size: int = 3) -> int:
+    """
+    SimHash fingerprint of a text over lowercased word shingles.
+    
+    Texts that share most of their shingles get fingerprints that differ
+    in only a few bits, so Hamming distance approximates dissimilarity.
+    
+    Args:
+        text: Text to fingerprint
+        bits: Fingerprint width (at most 512)
+        shingle_size: Words per shingle
+        
+    Returns:
+        Fingerprint as a non-negative integer
+    """
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < shingle_size:
+        shingles = [' '.join(words)] if words else []
+    else:
+        shingles = [' '.join(words[i:i + shingle_size])
+                    for i in range(len(words) - shingle_size + 1)]
+    
+    if not shingles:
+        return 0
+    
+    # Tally each bit position across all shingle hashes by transposing
+    # their binary strings, instead of looping over bits in Python
+    hashes = []
+    for shingle in set(shingles):
+        digest = hashlib.blake2b(shingle.encode('utf-8'), digest_size=bits // 8).digest()
+        hashes.append(format(int.from_bytes(digest, 'big'), f'0{bits}b'))
+    majority = len(hashes) / 2
+    return int(''.join('1' if column.count('1') > majority else '0'
+                       for column in zip(*hashes)), 2)
+
+def simhash_similarity(a: int, b: int, bits: int = 64) -> float:
+    """Fraction of matching bits between two SimHash fingerprints."""
+    return 1.0 - bin(a ^ b).count('1') / bits
+
+def find_near_duplicates(chunks: List[str], threshold: float = 0.9,
+                         bits: int = 64) -> List[Optional[int]]:
+    """
+    Map each chunk to the first earlier chunk it nearly duplicates.
+    
+    Args:
+        chunks: Chunks in document order (e.g. from chunk_text)
+        threshold: Minimum SimHash similarity (0-1) to count as a duplicate;
+                   0.9 allows 6 differing bits out of 64
+        bits: Fingerprint width
+        
+    Returns:
+        List the same length as chunks: the index of the first occurrence
+        for near-duplicates, None for chunks that are new
+    """
+    originals = []  # (index, fingerprint) of first occurrences
+    duplicate_of = []
+    for i, chunk in enumerate(chunks):
+        fingerprint = simhash(chunk, bits)
+        match = None
+        for j, other in originals:
+            if simhash_similarity(fingerprint, other, bits) >= threshold:
+                match = j
+                break
+        if match is None:
+            originals.append((i, fingerprint))
+        duplicate_of.append(match)
+    return duplicate_of
 
 def calculate_read_time(text: str, words_per_minute: int = 150) -> float:
     """
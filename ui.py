@@ -1,7 +1,6 @@
 # ui.py - FIXED VERSION
 import streamlit as st
 import os
-import tempfile
 import sys
 import time
 
@@ -15,9 +14,14 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-def simple_pipeline(pdf_path, output_dir, use_tts="gtts"):
-    """Simplified pipeline for Web UI"""
-    import pdfplumber
+@st.cache_resource
+def get_extraction_cache():
+    """Extraction cache shared across Streamlit reruns."""
+    from pdf2lecture.cache import ExtractionCache
+    return ExtractionCache()
+
+def simple_pipeline(pdf_source, output_dir, use_tts="gtts"):
+    """Simplified pipeline for Web UI (pdf_source: path, PDF bytes or file object)"""
     from gtts import gTTS
     from pptx import Presentation
     from pptx.util import Inches
@@ -28,14 +32,9 @@ def simple_pipeline(pdf_path, output_dir, use_tts="gtts"):
     results = {}
     
     # 1. Extract text
-    text_parts = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
-            if text and text.strip():
-                text_parts.append(text.strip())
-    
-    full_text = "\n\n".join(text_parts)
+    from pdf2lecture.extractor import PdfDocument
+    with PdfDocument(pdf_source, cache=get_extraction_cache()) as doc:
+        full_text = doc.extract_text()
     
     if len(full_text) < 100:
         raise Exception("Not enough text extracted from PDF")
@@ -188,26 +187,20 @@ def main():
             if show_preview:
                 with st.expander("📄 PDF Content Preview", expanded=False):
                     try:
-                        import pdfplumber
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                            tmp_file.write(uploaded_file.getvalue())
-                            tmp_path = tmp_file.name
-                        
-                        with pdfplumber.open(tmp_path) as pdf:
-                            if len(pdf.pages) > 0:
-                                first_page = pdf.pages[0]
-                                text = first_page.extract_text()
+                        from pdf2lecture.extractor import PdfDocument
+                        # Parse the upload in memory; the cache is keyed by content
+                        with PdfDocument(uploaded_file.getvalue(), cache=get_extraction_cache()) as doc:
+                            if doc.page_count > 0:
+                                text = doc.page_text(0)
                                 if text:
                                     st.text_area("First Page Content", text[:500] + "..." if len(text) > 500 else text, height=150, key="preview")
                                 else:
                                     st.warning("Could not extract text from first page")
                                     # Try alternative extraction
-                                    words = first_page.extract_words()
+                                    words = doc.plumber_pdf.pages[0].extract_words()
                                     if words:
                                         alt_text = ' '.join(word['text'] for word in words[:50])
                                         st.text_area("Extracted Words", alt_text + "...", height=100)
-                        
-                        os.unlink(tmp_path)
                     except Exception as e:
                         st.error(f"Preview error: {e}")
             
@@ -217,11 +210,6 @@ def main():
                 status_text = st.empty()
                 
                 try:
-                    # Save uploaded file temporarily
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                        tmp_file.write(uploaded_file.getvalue())
-                        pdf_path = tmp_file.name
-                    
                     # Create output directory
                     output_dir = f"web_output_{uploaded_file.name.replace('.pdf', '')}"
                     
@@ -241,7 +229,7 @@ def main():
                     progress_bar.progress(60)
                     
                     # Run the pipeline
-                    results = simple_pipeline(pdf_path, output_dir, tts_engine)
+                    results = simple_pipeline(uploaded_file.getvalue(), output_dir, tts_engine)
                     
                     status_text.text("Step 5/6: Creating video...")
                     progress_bar.progress(80)
@@ -307,8 +295,6 @@ def main():
                     # Clean up
                     status_text.empty()
                     progress_bar.empty()
-                    if 'pdf_path' in locals() and os.path.exists(pdf_path):
-                        os.unlink(pdf_path)
     
     with col2:
         st.subheader("ℹ️ How It Works")